@@ -0,0 +1,412 @@
+import os
+import threading
+import time
+
+import cv2
+
+# Camera profiles: the idle one keeps USB bandwidth, decoding and CPU low while
+# nobody is at the kiosk, the active one is used as soon as someone shows up.
+CAMERA_PROFILES = {
+    "idle": {"width": 320, "height": 240, "fps": 5},
+    "active": {"width": 640, "height": 480, "fps": 30},
+}
+
+
+# ========================================= frame buffer ============================================
+class LatestFrame:
+    """Single-slot frame buffer where the newest frame always wins.
+
+    The capture thread publishes every frame it reads; a frame that is replaced
+    before anyone read it is counted as dropped instead of being queued, so
+    readers never fall behind real time.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._frame = None
+        self._timestamp = 0.0
+        self._sequence = 0
+        self._consumed = True
+        self.frames_published = 0
+        self.frames_dropped = 0
+
+    def publish(self, frame):
+        """Replace the stored frame with a newer one."""
+        with self._condition:
+            if not self._consumed:
+                self.frames_dropped += 1
+            self._frame = frame
+            self._timestamp = time.monotonic()
+            self._sequence += 1
+            self._consumed = False
+            self.frames_published += 1
+            self._condition.notify_all()
+
+    def get(self, last_sequence=0, timeout=None):
+        """Wait for a frame newer than last_sequence.
+
+        Returns (sequence, frame, timestamp), or (last_sequence, None, 0.0) on timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._sequence > last_sequence, timeout=timeout):
+                return last_sequence, None, 0.0
+            self._consumed = True
+            return self._sequence, self._frame, self._timestamp
+
+    def stats(self):
+        with self._condition:
+            return {"published": self.frames_published, "dropped": self.frames_dropped}
+# ===================================================================================================
+
+# ========================================= capture thread ==========================================
+def apply_camera_profile(cap, profile):
+    """Set resolution and frame rate on an open capture device."""
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, profile["width"])
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, profile["height"])
+    cap.set(cv2.CAP_PROP_FPS, profile["fps"])
+
+
+class CaptureThread:
+    """Read frames from a cv2.VideoCapture as fast as the camera delivers them."""
+
+    def __init__(self, cap, frame_buffer=None):
+        self.cap = cap
+        self.frame_buffer = frame_buffer or LatestFrame()
+        self.is_running = False
+        self.thread = None
+        self.read_failures = 0
+        self.pending_profile = None
+        self.frame_interval = 0.0  # Minimum seconds between published frames, 0 for no limit
+        self.last_publish_time = 0.0
+
+        # Keep the driver queue as short as possible; not every backend supports it
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def start(self):
+        self.is_running = True
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def set_profile(self, profile):
+        """Ask the capture thread to switch profile before its next read.
+
+        The device is only touched from the capture thread, which keeps it open
+        while switching.
+        """
+        self.pending_profile = profile
+
+    def run(self):
+        while self.is_running:
+            profile = self.pending_profile
+            if profile is not None:
+                self.pending_profile = None
+                apply_camera_profile(self.cap, profile)
+                self.frame_interval = 1.0 / profile["fps"] if profile.get("fps") else 0.0
+
+            # Many webcams ignore CAP_PROP_FPS; grab every frame but only decode the ones we publish.
+            # The 10% slack keeps camera timing jitter from skipping frames at the profile rate.
+            if not self.cap.grab():
+                self.read_failures += 1
+                time.sleep(0.1)
+                continue
+            if self.frame_interval and time.monotonic() - self.last_publish_time < self.frame_interval * 0.9:
+                continue
+
+            ret, frame = self.cap.retrieve()
+            if not ret:
+                self.read_failures += 1
+                time.sleep(0.1)
+                continue
+            self.last_publish_time = time.monotonic()
+            self.frame_buffer.publish(frame)
+
+    def stop(self, timeout=1.0):
+        self.is_running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
+# ===================================================================================================
+
+# ========================================= power profile ===========================================
+class CameraPowerManager:
+    """Drop the camera to the idle profile after a quiet period and wake it on activity."""
+
+    def __init__(self, capture_thread, profiles=None, quiet_period=30.0):
+        self.capture_thread = capture_thread
+        self.profiles = profiles or CAMERA_PROFILES
+        self.quiet_period = quiet_period
+        self.profile_name = None
+        self.last_activity = time.monotonic()
+        self.switches = 0
+        self.switch("active")
+
+    def switch(self, name):
+        if name == self.profile_name:
+            return
+        self.capture_thread.set_profile(self.profiles[name])
+        self.profile_name = name
+        self.switches += 1
+        print(f"Camera profile: {name}")
+
+    def is_idle(self):
+        return self.profile_name == "idle"
+
+    def activity(self):
+        """Motion or a face was seen: make sure the camera runs the active profile."""
+        self.last_activity = time.monotonic()
+        self.switch("active")
+
+    def update(self):
+        """Go idle once nothing has happened for the quiet period."""
+        if time.monotonic() - self.last_activity > self.quiet_period:
+            self.switch("idle")
+# ===================================================================================================
+
+# ========================================= frame pacing ============================================
+class FrameRateGovernor:
+    """Pace a processing loop at a target frame rate on the monotonic clock.
+
+    Every frame gets a budget of 1 / target_fps seconds; end_frame() sleeps
+    only for what is left of it, so the rate no longer depends on how long
+    detection took. When frames keep overrunning the budget the target is
+    lowered towards min_fps, and raised again once there is plenty of headroom.
+    """
+
+    def __init__(self, target_fps=30.0, min_fps=10.0, adaptive=True, overrun_frames=15, recover_frames=90):
+        self.max_fps = target_fps
+        self.min_fps = min(min_fps, target_fps)
+        self.target_fps = target_fps
+        self.adaptive = adaptive
+        self.overrun_frames = overrun_frames  # Frames over budget in a row before the target drops
+        self.recover_frames = recover_frames  # Frames under half the budget in a row before it rises again
+
+        self.next_frame_time = None
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.overruns = 0
+        self.underruns = 0
+
+        # Stats, as running averages
+        self.fps = 0.0
+        self.work_time = 0.0
+        self.stage_times = {}
+        self.last_frame_end = None
+
+    @property
+    def budget(self):
+        return 1.0 / self.target_fps
+
+    def begin_frame(self):
+        now = time.monotonic()
+        if self.next_frame_time is None:
+            self.next_frame_time = now
+        self.frame_start = now
+        self.last_mark = now
+
+    def mark(self, stage):
+        """Record the time spent since the previous mark (or frame start) against a stage."""
+        now = time.monotonic()
+        elapsed = now - self.last_mark
+        self.last_mark = now
+        average = self.stage_times.get(stage, elapsed)
+        self.stage_times[stage] = average + (elapsed - average) * 0.1
+
+    def end_frame(self):
+        """Sleep for whatever is left of this frame's budget."""
+        now = time.monotonic()
+        work = now - self.frame_start
+        self.work_time += (work - self.work_time) * 0.1
+        if self.last_frame_end is not None and now > self.last_frame_end:
+            self.fps += (1.0 / (now - self.last_frame_end) - self.fps) * 0.1
+        self.last_frame_end = now
+
+        if self.adaptive:
+            self._adapt(work)
+
+        # Deadlines advance by the budget; after an overrun start again from now instead of catching up
+        self.next_frame_time = max(self.next_frame_time + self.budget, now)
+        delay = self.next_frame_time - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def _adapt(self, work):
+        budget = self.budget
+        self.overruns = self.overruns + 1 if work > budget else 0
+        self.underruns = self.underruns + 1 if work < budget * 0.5 else 0
+        if self.overruns >= self.overrun_frames and self.target_fps > self.min_fps:
+            self.target_fps = max(self.min_fps, self.target_fps * 0.8)
+            self.overruns = 0
+            print(f"Frame rate target lowered to {self.target_fps:.1f} FPS")
+        elif self.underruns >= self.recover_frames and self.target_fps < self.max_fps:
+            self.target_fps = min(self.max_fps, self.target_fps * 1.1)
+            self.underruns = 0
+
+    def idle(self):
+        """Wait one frame budget while the loop has nothing to do, e.g. while paused."""
+        self.next_frame_time = None
+        self.last_frame_end = None
+        time.sleep(self.budget)
+
+    def stats(self):
+        budget_ms = self.budget * 1000.0
+        return {
+            "target_fps": round(self.target_fps, 1),
+            "achieved_fps": round(self.fps, 1),
+            "budget_ms": round(budget_ms, 1),
+            "budget_used": round(self.work_time * 1000.0 / budget_ms, 2),
+            "stage_budget_used": {
+                stage: round(elapsed * 1000.0 / budget_ms, 2) for stage, elapsed in self.stage_times.items()
+            },
+        }
+# ===================================================================================================
+
+# ========================================= camera source ===========================================
+class CameraSource:
+    """One camera: the open device, its capture thread, newest-frame slot and power profile."""
+
+    def __init__(self, camera_index=0, profiles=None, quiet_period=30.0):
+        self.camera_index = camera_index
+        self.cap = cv2.VideoCapture(camera_index)
+        self.frame_buffer = LatestFrame()
+        self.capture_thread = CaptureThread(self.cap, self.frame_buffer)
+        self.power = CameraPowerManager(self.capture_thread, profiles=profiles, quiet_period=quiet_period)
+        self.start_time = None
+
+    def start(self):
+        self.start_time = time.monotonic()
+        self.capture_thread.start()
+
+    def media_time(self):
+        """Seconds since capture started, the live counterpart of ReplaySource.media_time."""
+        return time.monotonic() - self.start_time
+
+    def read(self, last_sequence=0, timeout=0.5):
+        """Newest frame after last_sequence, as (sequence, frame, timestamp); frame is None on timeout."""
+        return self.frame_buffer.get(last_sequence, timeout=timeout)
+
+    def stop(self):
+        self.capture_thread.stop()
+        self.cap.release()
+# ===================================================================================================
+
+# ========================================= replay sources ==========================================
+class FixedProfile:
+    """Power manager stand-in for frame sources that have no camera profiles."""
+
+    profile_name = "active"
+
+    def is_idle(self):
+        return False
+
+    def activity(self):
+        pass
+
+    def update(self):
+        pass
+
+
+class ReplaySource:
+    """Base for offline frame sources, read with the same interface as CameraSource.
+
+    Frames are returned one after the other, never dropped. With realtime=True
+    read() waits until each frame is due at its recorded rate; otherwise the
+    frames come as fast as the pipeline asks for them.
+    """
+
+    def __init__(self, fps=30.0, realtime=True):
+        self.fps = fps
+        self.realtime = realtime
+        self.power = FixedProfile()
+        self.frame_index = 0
+        self.finished = False
+        self.start_time = None
+
+    def start(self):
+        self.start_time = time.monotonic()
+
+    def media_time(self):
+        """Recorded time of the last frame, in seconds from the start of the recording."""
+        return max(self.frame_index - 1, 0) / self.fps
+
+    def _next_frame(self):
+        raise NotImplementedError
+
+    def read(self, last_sequence=0, timeout=0.5):
+        if self.start_time is None:
+            self.start()
+        frame = None if self.finished else self._next_frame()
+        if frame is None:
+            self.finished = True
+            time.sleep(min(timeout, 0.1))
+            return last_sequence, None, 0.0
+
+        self.frame_index += 1
+        if self.realtime:
+            due = self.start_time + self.media_time()
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return self.frame_index, frame, time.monotonic()
+
+    def stop(self):
+        pass
+
+
+class VideoFileSource(ReplaySource):
+    """Frames from a recorded video file."""
+
+    def __init__(self, path, realtime=True):
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise ValueError(f"Could not open video: {path}")
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS) or 30.0, realtime)
+
+    def _next_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def stop(self):
+        self.cap.release()
+
+
+class ImageDirectorySource(ReplaySource):
+    """Frames from a directory of images, in file name order."""
+
+    IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+    def __init__(self, path, fps=30.0, realtime=True):
+        super().__init__(fps, realtime)
+        self.paths = sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if name.lower().endswith(self.IMAGE_EXTENSIONS)
+        )
+        if not self.paths:
+            raise ValueError(f"No images found in: {path}")
+
+    def _next_frame(self):
+        while self.frame_index < len(self.paths):
+            frame = cv2.imread(self.paths[self.frame_index])
+            if frame is not None:
+                return frame
+            print(f"Could not read image: {self.paths[self.frame_index]}")
+            del self.paths[self.frame_index]
+        return None
+
+
+def open_frame_source(source, config=None, realtime=True):
+    """Open a frame source from its config entry.
+
+    An int (or digit string) is a camera index, a directory is read as an image
+    sequence and anything else as a video file.
+    """
+    config = config or {}
+    if isinstance(source, int) or str(source).isdigit():
+        return CameraSource(
+            int(source),
+            profiles=config.get("camera_profiles", CAMERA_PROFILES),
+            quiet_period=config.get("camera_quiet_period", 30.0)
+        )
+    if os.path.isdir(source):
+        return ImageDirectorySource(source, fps=config.get("replay_fps", 30.0), realtime=realtime)
+    return VideoFileSource(source, realtime=realtime)
+# ===================================================================================================
@@ -0,0 +1,62 @@
+import io
+
+from pydub import AudioSegment
+from pydub.utils import which
+
+# Spoken case details, one tuple per sentence: ("prompt", id) is a fixed fragment from
+# prompt_pack.PROMPTS, ("field", key) a value from the case details returned by the case server
+CASE_READOUT = (
+    (("prompt", "readout_case_type"), ("field", "case_type")),
+    (("prompt", "readout_case_number"), ("field", "case_no"),
+     ("prompt", "readout_filing_year"), ("field", "case_year")),
+    (("prompt", "readout_petitioner"), ("field", "petitioner_name")),
+    (("prompt", "readout_respondent"), ("field", "respondent_name")),
+    (("prompt", "readout_advocate"), ("field", "advocate_name")),
+    (("prompt", "readout_status"), ("field", "status")),
+    (("prompt", "readout_next_date"), ("field", "next_date"),
+     ("prompt", "readout_thanks")),
+)
+
+# Fields that are words rather than codes, numbers or dates, translated like in the case table
+TRANSLATED_FIELDS = ("petitioner_name", "respondent_name", "advocate_name", "status")
+
+
+# ========================================= case readout ============================================
+def readout_available():
+    """Whether pydub can decode and join MP3 fragments, which needs ffmpeg on the PATH."""
+    return which("ffmpeg") is not None
+
+
+def readout_parts(sentence, case_details, lang, prompt, translate):
+    """(kind, text) of every part of one CASE_READOUT sentence: fixed fragments via prompt(id, lang),
+    field values as they come.
+
+    translate(text) is applied to the TRANSLATED_FIELDS values when lang is not English.
+    """
+    parts = []
+    for kind, name in sentence:
+        if kind == "prompt":
+            text = prompt(name, lang)
+        else:
+            text = str(case_details.get(name, "")).strip()
+            if text and lang != "en" and name in TRANSLATED_FIELDS:
+                text = translate(text)
+        if text:
+            parts.append((kind, text))
+    return parts
+
+
+def join_speech(segments, gap_ms=150):
+    """Join MP3 files or byte strings into one MP3, with a short pause between them."""
+    gap = AudioSegment.silent(duration=gap_ms)
+    joined = AudioSegment.empty()
+    for segment in segments:
+        source = io.BytesIO(segment) if isinstance(segment, bytes) else segment
+        if len(joined):
+            joined += gap
+        joined += AudioSegment.from_file(source, format="mp3")
+
+    buffer = io.BytesIO()
+    joined.export(buffer, format="mp3")
+    return buffer.getvalue()
+# ===================================================================================================
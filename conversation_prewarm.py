@@ -0,0 +1,134 @@
+import contextlib
+import threading
+import time
+
+import requests
+import speech_recognition as sr
+
+
+# ========================================= conversation pre-warming ================================
+class ConversationPrewarmer:
+    """Get the microphone, greeting audio and HTTP connection ready before a visitor is in range.
+
+    start() runs the slow preparation in a background thread: open the
+    microphone and calibrate it to the room, render the greeting, and open a
+    keep-alive connection to the case server. The conversation then picks up
+    whatever is ready and falls back to the usual path for the rest.
+    A preparation nobody used is released after max_age seconds.
+    """
+
+    def __init__(self, prepare_greeting=None, warm_url=None, http_session=None,
+                 calibration_time=1.0, max_age=20.0):
+        self.prepare_greeting = prepare_greeting  # Callable that renders the greeting audio
+        self.warm_url = warm_url
+        self.http_session = http_session or requests.Session()
+        self.calibration_time = calibration_time
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self.recognizer = None
+        self.source = None
+        self.prepared_at = 0.0
+        self.in_use = False
+
+        # Stats
+        self.warmups = 0
+        self.used = 0
+        self.expired = 0
+
+    def start(self):
+        """Start preparing, unless a preparation is already running or ready."""
+        with self._lock:
+            if self.in_use or self.source is not None or (self._thread and self._thread.is_alive()):
+                return False
+            self.warmups += 1
+            self._thread = threading.Thread(target=self._prepare)
+            self._thread.daemon = True
+            self._thread.start()
+        return True
+
+    def _prepare(self):
+        started = time.perf_counter()
+        try:
+            recognizer = sr.Recognizer()
+            source = sr.Microphone()
+            source.__enter__()
+            recognizer.adjust_for_ambient_noise(source, duration=self.calibration_time)
+            with self._lock:
+                self.recognizer = recognizer
+                self.source = source
+                self.prepared_at = time.monotonic()
+        except Exception as e:
+            print(f"Microphone pre-warm error: {e}")
+
+        if self.prepare_greeting is not None:
+            try:
+                self.prepare_greeting()
+            except Exception as e:
+                print(f"Greeting pre-warm error: {e}")
+
+        if self.warm_url:
+            try:
+                # Any response leaves a pooled connection behind for the case lookup
+                self.http_session.head(self.warm_url, timeout=2)
+            except requests.exceptions.RequestException as e:
+                print(f"Connection pre-warm error: {e}")
+
+        print(f"Conversation pre-warmed in {(time.perf_counter() - started) * 1000.0:.0f} ms")
+
+    def microphone(self):
+        """Return (recognizer, microphone) for a calibrated, already open microphone, or None.
+
+        microphone is a context manager like sr.Microphone; the pre-warmed
+        microphone is closed when it exits.
+        """
+        with self._lock:
+            if self.source is None:
+                return None
+            if not self.in_use:
+                self.in_use = True
+                self.used += 1
+            source = self.source
+            recognizer = self.recognizer
+
+        # Throw away audio that queued up while the greeting played
+        try:
+            available = source.stream.pyaudio_stream.get_read_available()
+            if available:
+                source.stream.read(available)
+        except Exception:
+            pass
+        return recognizer, self._reserved(source)
+
+    @contextlib.contextmanager
+    def _reserved(self, source):
+        try:
+            yield source
+        finally:
+            self.release()
+
+    def expire(self):
+        """Release a preparation that nobody came to use."""
+        with self._lock:
+            if self.in_use or self.source is None or time.monotonic() - self.prepared_at < self.max_age:
+                return
+            self.expired += 1
+        self.release()
+
+    def release(self):
+        """Close the pre-warmed microphone, e.g. at the end of the conversation."""
+        with self._lock:
+            source = self.source
+            self.source = None
+            self.recognizer = None
+            self.in_use = False
+        if source is not None:
+            try:
+                source.__exit__(None, None, None)
+            except Exception as e:
+                print(f"Microphone release error: {e}")
+
+    def stats(self):
+        return {"warmups": self.warmups, "used": self.used, "expired": self.expired}
+# ===================================================================================================
@@ -3,6 +3,7 @@ import asyncio
 from gtts import gTTS
 import os
 import cv2
+from face_detection import create_face_detector
 from PIL import Image, ImageTk
 import json
 import subprocess
@@ -84,6 +85,11 @@ class CourtApplication:
         self.cap = None
         with open('case_db.json', 'r') as f: 
             self.case_db = json.load(f)
+        try:
+            with open('kiosk_config.json', 'r', encoding='utf-8') as f:
+                self.kiosk_config = json.load(f)
+        except FileNotFoundError:
+            self.kiosk_config = {}
         self.conversation = Conversation()
         self.case_number_entry = None
         self.text_area = None
@@ -181,7 +187,8 @@ class CourtApplication:
 
     async def detect_face_and_ask_case_number(self):
         try:
-            face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+            face_detector = create_face_detector(self.kiosk_config.get('face_detector', 'haar'),
+                                                 **self.kiosk_config.get('face_detector_options', {}))
             self.cap = cv2.VideoCapture(0)
             
             while True:
@@ -190,10 +197,10 @@ class CourtApplication:
                     break
                 
                 gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                roi = gray[int(frame.shape[0] * 0.25):int(frame.shape[0] * 0.75), 
+                image = frame if face_detector.color else gray
+                roi = image[int(frame.shape[0] * 0.25):int(frame.shape[0] * 0.75), 
                            int(frame.shape[1] * 0.25):int(frame.shape[1] * 0.75)]
-                faces = face_cascade.detectMultiScale(roi, scaleFactor=1.1, minNeighbors=5, 
-                                                      minSize=(150, 150), maxSize=(300, 300))
+                faces = face_detector.detect(roi, (150, 150), (300, 300))
                 
                 if len(faces) > 0:
                     for (x, y, w, h) in faces:
@@ -9,6 +9,7 @@ from deep_translator import GoogleTranslator
 import speech_recognition as sr
 from PIL import Image
 import cv2
+from face_detection import DETECTION_SCALE, detect_faces_scaled
 import threading
 import requests
 import re
@@ -60,6 +61,7 @@ class HighCourt:
 
         # Face detection variables
         self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        self.detection_scale = DETECTION_SCALE  # Fraction of the frame resolution the cascade runs on
         self.cap = None
         self.is_running = False
         self.detection_thread = None
@@ -379,12 +381,12 @@ class HighCourt:
             gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
             
             # Detect faces with min/max size constraints
-            faces = self.face_cascade.detectMultiScale(
+            faces = detect_faces_scaled(
+                self.face_cascade,
                 gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=min_face_size,
-                maxSize=max_face_size
+                min_face_size,
+                max_face_size,
+                detection_scale=self.detection_scale
             )
             
             # Convert frame to PIL format for displaying
@@ -1,20 +1,174 @@
-import os
+import io
 import json
 from gtts import gTTS
 import pygame
 import time
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import messagebox, ttk
 from deep_translator import GoogleTranslator
 import speech_recognition as sr
-from PIL import Image
+from PIL import Image, ImageTk
 import cv2
+import numpy as np
+from face_detection import (FACE_IN_RANGE, FACE_OUT_OF_ZONE, FACE_TOO_CLOSE, FACE_TOO_FAR, ApproachPredictor,
+                            PresenceTracker, VisitorCache, classify_faces, create_face_pipeline, face_signature)
+from detection_worker import DetectionProcess
+from camera_capture import CameraSource, FrameRateGovernor, LatestFrame, open_frame_source
+from conversation_prewarm import ConversationPrewarmer
+from latency_trace import TRACE_STAGES, LatencyTracer
+from tts_cache import TTSCache, split_sentences
+from prompt_pack import PROMPT_PACK_DIR, PROMPTS, PromptPack
+from case_readout import CASE_READOUT, join_speech, readout_available, readout_parts
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import re
 from difflib import get_close_matches
 import winsound
+from mutagen.mp3 import MP3
+
+BASE_URL = "http://192.168.1.12:8000/cases"
+
+# Preview box style per face status: (label, colour, thickness, show size)
+FACE_STYLES = {
+    FACE_IN_RANGE: ("DETECTED", (255, 0, 0), 3, True),
+    FACE_TOO_FAR: ("TOO FAR", (0, 255, 255), 2, True),
+    FACE_TOO_CLOSE: ("TOO CLOSE", (0, 255, 255), 2, True),
+    FACE_OUT_OF_ZONE: ("OUT OF ZONE", (0, 255, 0), 2, False),
+}
+
+# ===================================================================================================================
+class CameraPreview(tk.Label):
+    """Live camera preview that owns a single PhotoImage and updates its pixels in place."""
+
+    def __init__(self, master, size, **kwargs):
+        self.size = size
+        self.photo = ImageTk.PhotoImage("RGB", size)
+        super().__init__(master, image=self.photo, width=size[0], height=size[1], bd=0, **kwargs)
+
+    def show(self, image):
+        """Blit a PIL image of the preview size into the existing PhotoImage (main thread only)."""
+        self.photo.paste(image)
+
+#==========================================================================================================
+class CameraChannel:
+    """Everything one camera needs: frame source, face pipeline, presence tracking, buffers and stats."""
+
+    def __init__(self, camera_index, config):
+        self.camera_index = camera_index
+        self.camera = None             # CameraSource when detection runs in a thread
+        self.detection_process = None  # DetectionProcess when detection runs in a worker process
+        self.thread = None
+
+        # Detector backend, zone, motion gate and detect-then-track scheduler, set up from kiosk_config.json
+        self.face_pipeline = create_face_pipeline(config)
+        self.presence_tracker = PresenceTracker(window=10, enter_count=6, exit_count=2)  # Face must stay in zone before a conversation starts
+        self.approach_predictor = ApproachPredictor(lead_time=1.5)  # Face still too far away but coming closer
+
+        # Paces the detection loop at the configured rate, lowering it when the machine cannot keep up
+        self.governor = FrameRateGovernor(
+            target_fps=config.get("target_fps", 30.0),
+            min_fps=config.get("min_fps", 10.0),
+            adaptive=config.get("adaptive_fps", True)
+        )
+
+        # Preallocated frame buffers, reused every frame instead of allocating new arrays
+        self.frame_buffer_shape = None
+        self.gray_frame = None
+        self.rgb_frame = None
+
+        # Zone rectangle and range texts, rendered once per resolution
+        self.overlay_key = None
+        self.overlay_image = None
+        self.overlay_mask = None
+
+        # Stats
+        self.frame_age = 0.0  # Seconds between capture and detection of the last frame
+        self.fps = 0.0
+        self.detection_latency = 0.0  # ms, running average
+        self.fps_frames = 0
+        self.fps_start = time.monotonic()
+        self.frame_time = 0.0   # Capture time of the last processed frame
+        self.detected_at = 0.0  # When detection on that frame finished
+
+    def frame_buffers(self, shape):
+        """Return the preallocated gray and RGB buffers for frames of this shape"""
+        if shape != self.frame_buffer_shape:
+            height, width = shape[:2]
+            self.gray_frame = np.empty((height, width), dtype=np.uint8)
+            self.rgb_frame = np.empty((height, width, 3), dtype=np.uint8)
+            self.frame_buffer_shape = shape
+        return self.gray_frame, self.rgb_frame
+
+    def static_overlay(self, shape, zone_rect):
+        """Return the (image, mask) of the parts of the overlay that do not change between frames"""
+        min_face_size = self.face_pipeline.min_face_size
+        max_face_size = self.face_pipeline.max_face_size
+        key = (shape[:2], zone_rect, min_face_size, max_face_size)
+        if key != self.overlay_key:
+            height, width = shape[:2]
+            x_start, y_start, x_end, y_end = zone_rect
+            overlay = np.zeros((height, width, 3), dtype=np.uint8)
+
+            # Draw detection zone rectangle
+            cv2.rectangle(overlay, (x_start, y_start), (x_end, y_end), (0, 255, 0), 2)
+
+            # Add text indicators for range
+            cv2.putText(overlay, "Detection Range", (10, 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            cv2.putText(overlay, "Min: " + str(min_face_size[0]) + "px", (10, 60),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 200, 0), 2)
+            cv2.putText(overlay, "Max: " + str(max_face_size[0]) + "px", (10, 90),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 200, 0), 2)
 
+            # Nothing is drawn in black, so every non-black pixel belongs to the overlay
+            self.overlay_mask = overlay.any(axis=2, keepdims=True)
+            self.overlay_image = overlay
+            self.overlay_key = key
+        return self.overlay_image, self.overlay_mask
+
+    def record_frame(self, frame_time, detection_ms):
+        """Update FPS, frame age and detection latency after a processed frame"""
+        now = time.monotonic()
+        self.frame_time = frame_time
+        self.detected_at = now
+        self.frame_age = now - frame_time
+        self.detection_latency += (detection_ms - self.detection_latency) * 0.1
+        self.fps_frames += 1
+        if now - self.fps_start >= 1.0:
+            self.fps = self.fps_frames / (now - self.fps_start)
+            self.fps_frames = 0
+            self.fps_start = now
+
+    def stats(self):
+        stats = {
+            "camera": self.camera_index,
+            "fps": round(self.fps, 1),
+            "detection_latency_ms": round(self.detection_latency, 2),
+            "frame_age_ms": round(self.frame_age * 1000.0, 1),
+        }
+        # Detector backend, motion gate and detect/track counts; in process mode from the worker's pipeline
+        if self.detection_process is not None:
+            stats["pipeline"] = self.detection_process.pipeline_stats
+        else:
+            stats["pipeline"] = self.face_pipeline.stats()
+        stats.update(self.presence_tracker.stats())
+        stats["approach_predictions"] = self.approach_predictor.predictions
+        stats.update(self.governor.stats())
+        if isinstance(self.camera, CameraSource):
+            stats.update(self.camera.frame_buffer.stats())
+        return stats
+
+    def stop(self):
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+        if self.camera is not None:
+            self.camera.stop()
+        if self.detection_process is not None:
+            self.detection_process.stop()
+
+#==========================================================================================================
 class HighCourt:
     # =========================================== Constructore ==========================================
     def __init__(self, root):
@@ -36,6 +190,9 @@ class HighCourt:
         # Load authentication data
         self.load_auth_data()
 
+        # Load kiosk settings
+        self.load_kiosk_config()
+
         # Reset flags after inactivity
         self.reset_flags_after_inactivity()
 
@@ -59,12 +216,55 @@ class HighCourt:
         self.heading_label.pack(fill="x", pady=10)
 
         # Face detection variables
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        self.cap = None
+        # One channel per camera, each with its own capture, detection and presence tracking
+        self.camera_channels = [CameraChannel(index, self.kiosk_config) for index in self.kiosk_config.get("cameras", [0])]
+        self.preview_channel = self.camera_channels[0]  # Camera shown in the live preview
+        self.trigger_channel = None  # Camera that started the current conversation
+        self.trigger_signature = None  # Face signature of the visitor who started it
+        self.trigger_lock = threading.Lock()
+        self.visitor_cache = VisitorCache(ttl=120.0)  # Recently served visitors, in memory only, so they are not greeted again
         self.is_running = False
-        self.detection_thread = None
+
+        # Preallocated display buffers, reused every frame instead of allocating new arrays
+        self.display_size = (940, 420)
+        # Three display buffers: one being drawn, one waiting in the mailbox, one being shown by Tk
+        self.display_frames = [np.empty((self.display_size[1], self.display_size[0], 3), dtype=np.uint8) for _ in range(3)]
+        self.display_index = 0
+
+        # Single-slot mailbox between the detection thread and the Tk main loop
+        self.preview_mailbox = LatestFrame()
+        self.preview_sequence = 0
+        self.preview_job = None
         self.face_detected = False
         self.face_detection_cooldown = False
+        self.last_detection_time = 0
+        self.cooldown_period = 10  # 10 seconds cooldown
+
+        # Microphone, greeting and case server connection are prepared while a visitor is still approaching
+        self.http_session = requests.Session()
+        self.prompt_texts = {}  # (prompt id, lang) -> fixed prompt translated at runtime, when the pack lacks it
+        self.prewarmer = ConversationPrewarmer(
+            prepare_greeting=lambda: self.prepare_greeting(lang='pa'),
+            warm_url=BASE_URL,
+            http_session=self.http_session
+        )
+
+        # Fixed conversation prompts, translated and synthesized by the prompt pack build step
+        self.prompt_pack = PromptPack(self.kiosk_config.get("prompt_pack_dir", PROMPT_PACK_DIR))
+
+        # Synthesized speech on disk, so repeated prompts play without a gTTS round trip
+        self.tts_cache = TTSCache(
+            directory=self.kiosk_config.get("tts_cache_dir", "tts_cache"),
+            max_bytes=self.kiosk_config.get("tts_cache_mb", 200) * 1024 * 1024
+        )
+
+        # Case readouts join MP3 fragments with pydub, which needs ffmpeg; checked once here
+        self.readout_audio = readout_available()
+        if not self.readout_audio:
+            print("ffmpeg not found. Case details will be translated and synthesized as one text.")
+
+        # Timestamps from camera frame to first spoken word, per conversation
+        self.latency_tracer = LatencyTracer(log_path=self.kiosk_config.get("latency_log", "latency_log.jsonl"))
         
         # Create frame for camera feed
         self.image_frame = ctk.CTkFrame(
@@ -79,10 +279,11 @@ class HighCourt:
         self.image_frame.pack(padx=10, pady=10)
         
         # Create label for camera feed
-        self.image_label = ctk.CTkLabel(self.image_frame, text="", width=940, height=420)
+        self.image_label = CameraPreview(self.image_frame, self.display_size, bg="white")
         self.image_label.pack(padx=5, pady=5)
         
         self.start_camera()
+        self.render_preview()
 
         # Label for the text input box
         self.text_input_label = ctk.CTkLabel(self.main_frame, 
@@ -214,8 +415,10 @@ class HighCourt:
         # Add table for case details
         self.create_case_table()
 
-        # Initialize translators
+        # Initialize translators. A GoogleTranslator keeps the text of the request in progress
+        # on the instance, so readout sentences rendered in parallel take turns using it
         self._translators = {}
+        self._translator_lock = threading.Lock()
         
         # Buttons for speaking in different languages
         self.last_button_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -345,135 +548,194 @@ class HighCourt:
 
     # ========================================= face detection ==========================================
     def start_camera(self):
-        """Start the camera and face detection thread"""
+        """Start every configured camera, each with its own capture and face detection thread"""
         self.on_action_performed()
-        self.cap = cv2.VideoCapture(0)  # 0 is usually the built-in webcam
         self.is_running = True
-        
-        # Start detection in a separate thread
-        self.detection_thread = threading.Thread(target=self.detect_faces)
-        self.detection_thread.daemon = True
-        self.detection_thread.start()
-    
-    def detect_faces(self):
+
+        for channel in self.camera_channels:
+            if self.kiosk_config.get("detection_process", False):
+                # Capture and detection run in their own process; this thread only draws and triggers
+                channel.detection_process = DetectionProcess(self.kiosk_config, camera_index=channel.camera_index)
+                channel.detection_process.start()
+                target = self.receive_detections
+            else:
+                # A camera captures in its own thread so frames never queue up in the driver, with an
+                # idle low-res/low-FPS profile while nobody is around and the active profile otherwise.
+                # A video file or image directory replays a recording through the same pipeline.
+                channel.camera = open_frame_source(
+                    channel.camera_index,
+                    self.kiosk_config,
+                    realtime=self.kiosk_config.get("replay_realtime", True)
+                )
+                channel.camera.start()
+                target = self.detect_faces
+
+            # Start detection in a separate thread
+            channel.thread = threading.Thread(target=target, args=(channel,))
+            channel.thread.daemon = True
+            channel.thread.start()
+
+    def camera_stats(self):
+        """Per-camera FPS, detection latency, face pipeline and presence counters"""
+        return [channel.stats() for channel in self.camera_channels]
+
+    def next_display_buffer(self):
+        self.display_index = (self.display_index + 1) % len(self.display_frames)
+        return self.display_frames[self.display_index]
+
+    def detect_faces(self, channel):
         """Thread function for face detection with minimum and maximum range control"""
         self.on_action_performed()
-        last_detection_time = 0
-        cooldown_period = 10  # 10 seconds cooldown
-        min_face_size = (160, 160) 
-        max_face_size = (240, 240)
+        camera = channel.camera
+        governor = channel.governor
+        frame_sequence = 0
         
         while self.is_running:
-            # if self.camera_pause:
-            #     time.sleep(0.1)
-            #     continue
+            # Take the newest frame from the capture thread; older ones are dropped
+            frame_sequence, frame, frame_time = camera.read(frame_sequence, timeout=0.5)
+            if frame is None or self.camera_pause:
+                # Tracks and presence go stale while paused, start again from a full detection
+                channel.face_pipeline.reset()
+                channel.presence_tracker.reset()
+                governor.idle()
+                continue
+
+            governor.begin_frame()
+            detection_start = time.perf_counter()
+
+            # Convert to grayscale for face detection, into a reused buffer
+            gray, frame_rgb = channel.frame_buffers(frame.shape)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+            governor.mark("convert")
+
+            # Detect faces with min/max size constraints, tracking them between full detections.
+            # Face sizes are meaningless at idle resolution, so an idle frame only wakes the camera.
+            faces, zone_rect, active = channel.face_pipeline.process(gray, run_detector=not camera.power.is_idle(), frame=frame)
+            if active:
+                camera.power.activity()
+            else:
+                camera.power.update()
+            governor.mark("detect")
+
+            channel.record_frame(frame_time, (time.perf_counter() - detection_start) * 1000.0)
+            self.show_detections(channel, frame, faces, zone_rect, frame_rgb, gray, channel.face_pipeline.detected)
+            governor.mark("display")
+
+            # Sleep only for what is left of the frame budget
+            governor.end_frame()
 
-            ret, frame = self.cap.read()
-            if not ret or self.camera_pause:
+    def receive_detections(self, channel):
+        """Thread function that shows the faces found by a camera's detection process"""
+        self.on_action_performed()
+
+        while self.is_running:
+            channel.detection_process.set_paused(self.camera_pause)
+            if self.camera_pause:
+                channel.presence_tracker.reset()
                 time.sleep(0.1)
                 continue
-                
-            # Convert to grayscale for face detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # Detect faces with min/max size constraints
-            faces = self.face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=min_face_size,
-                maxSize=max_face_size
-            )
-            
-            # Convert frame to PIL format for displaying
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Draw detection zone (center 60% of the frame)
+
+            result = channel.detection_process.get(timeout=0.5)
+            if result is None:
+                continue
+            _, frame, frame_time, faces, detected, detection_ms = result
+            channel.record_frame(frame_time, detection_ms)
+
             height, width = frame.shape[:2]
-            x_start = int(width * 0.3)
-            x_end = int(width * 0.7)
-            y_start = int(height * 0.2)
-            y_end = int(height * 0.8)
-            
-            # Draw detection zone rectangle
-            cv2.rectangle(frame_rgb, (x_start, y_start), (x_end, y_end), (0, 255, 0), 2)
-            
-            # Add text indicators for range
-            cv2.putText(frame_rgb, "Detection Range", (10, 30), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            cv2.putText(frame_rgb, "Min: " + str(min_face_size[0]) + "px", (10, 60), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 200, 0), 2)
-            cv2.putText(frame_rgb, "Max: " + str(max_face_size[0]) + "px", (10, 90), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 200, 0), 2)
-            
-            face_in_zone = False
-
-            # Draw rectangle around the faces with distance indication
-            for (x, y, w, h) in faces:
-                if self.camera_pause:
-                    break
-
-                face_size = max(w, h)
-                # Calculate approximate distance indicator (inversely proportional to face size)
-                # This is a rough estimate - actual distance would require camera calibration
-                distance_factor = min_face_size[0] / face_size if face_size > 0 else 1
-                distance_indicator = f"Size: {face_size}px"
-                
-                # Determine if face is in optimal range
-                in_range = min_face_size[0] <= face_size <= max_face_size[0]
-                
-                # Check if face is in detection zone
-                face_center_x = x + w // 2
-                face_center_y = y + h // 2
-                
-                if (x_start < face_center_x < x_end and 
-                    y_start < face_center_y < y_end and in_range):
-                    # Face is in detection zone and optimal range - draw blue rectangle
-                    cv2.rectangle(frame_rgb, (x, y), (x+w, y+h), (255, 0, 0), 3)
-                    cv2.putText(frame_rgb, "DETECTED", (x, y-10), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-                    cv2.putText(frame_rgb, distance_indicator, (x, y+h+20), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-                    face_in_zone = True
-                elif (x_start < face_center_x < x_end and y_start < face_center_y < y_end):
-                    # Face is in zone but not in optimal range - draw yellow rectangle
-                    cv2.rectangle(frame_rgb, (x, y), (x+w, y+h), (0, 255, 255), 2)
-                    
-                    # Add text indicating why it's not detected
-                    if face_size < min_face_size[0]:
-                        range_text = "TOO FAR"
-                    elif face_size > max_face_size[0]:
-                        range_text = "TOO CLOSE"
-                        
-                    cv2.putText(frame_rgb, range_text, (x, y-10), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
-                    cv2.putText(frame_rgb, distance_indicator, (x, y+h+20), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
-                else:
-                    # Face is outside detection zone - draw green rectangle
-                    cv2.rectangle(frame_rgb, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                    cv2.putText(frame_rgb, "OUT OF ZONE", (x, y-10), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-            
-            # Check if we should trigger case number
+            zone_rect = channel.face_pipeline.zone_rect(width, height)
+            _, frame_rgb = channel.frame_buffers(frame.shape)
+            self.show_detections(channel, frame, faces, zone_rect, frame_rgb, detected=detected)
+
+    def request_conversation(self, channel, signature):
+        """Trigger arbiter shared by all cameras: start at most one conversation at a time"""
+        with self.trigger_lock:
             current_time = time.time()
+            if self.face_detection_cooldown or current_time - self.last_detection_time <= self.cooldown_period:
+                return False
+
+            # Don't greet again a visitor who was just served and is still standing here
+            if self.visitor_cache.recently_served(signature):
+                return False
+            self.trigger_signature = signature  # Remembered once the visitor answers
+
+            self.face_detected = True
+            self.last_detection_time = current_time
+            self.face_detection_cooldown = True
+            self.trigger_channel = channel
+            channel.presence_tracker.record_trigger()
+            self.latency_tracer.begin(channel.frame_time, channel.detected_at)
+            self.latency_tracer.mark("trigger")
+
+        self.root.after(0, self.face_mic_conversation)
+        return True
+
+    def show_detections(self, channel, frame, faces, zone_rect, frame_rgb, gray=None, detected=True):
+        """Draw the overlay, decide whether to start a conversation and post the frame to the preview"""
+        min_face_size = channel.face_pipeline.min_face_size
+        max_face_size = channel.face_pipeline.max_face_size
+
+        # Convert frame to RGB for displaying
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame_rgb)
+
+        # Zone rectangle and range texts come from a cached mask, copied in with one masked write
+        overlay, overlay_mask = channel.static_overlay(frame_rgb.shape, zone_rect)
+        np.copyto(frame_rgb, overlay, where=overlay_mask)
+
+        # In zone / too far / too close for all faces at once
+        boxes, status, sizes = classify_faces([] if self.camera_pause else faces, zone_rect, min_face_size, max_face_size)
+
+        in_range = np.flatnonzero(status == FACE_IN_RANGE)
+        face_in_zone = in_range.size > 0
+        zone_face = tuple(int(v) for v in boxes[in_range[-1]]) if face_in_zone else None
+
+        too_far = np.flatnonzero(status == FACE_TOO_FAR)
+        approaching_face = tuple(int(v) for v in boxes[too_far[np.argmax(sizes[too_far])]]) if too_far.size else None
+
+        # Draw rectangle around the faces with distance indication
+        for (x, y, w, h), face_status, face_size in zip(boxes.tolist(), status.tolist(), sizes.tolist()):
+            label, color, thickness, show_size = FACE_STYLES[face_status]
+            cv2.rectangle(frame_rgb, (x, y), (x+w, y+h), color, thickness)
+            cv2.putText(frame_rgb, label, (x, y-10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+            if show_size:
+                cv2.putText(frame_rgb, f"Size: {face_size}px", (x, y+h+20),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+
+        # Start getting the conversation ready while the visitor is still walking up.
+        # Tracked boxes keep their detected size, so only detector frames are fitted.
+        if channel.approach_predictor.update(approaching_face, zone_rect, min_face_size, measured=detected) and not self.face_detection_cooldown:
+            self.prewarmer.start()
+        else:
+            self.prewarmer.expire()
 
-            if face_in_zone and not self.face_detection_cooldown and (current_time - last_detection_time > cooldown_period):
-                self.face_detected = True
-                last_detection_time = current_time
-                self.face_detection_cooldown = True
-                
-                self.root.after(0, self.face_mic_conversation)
-            
-            # Convert the image to PIL format for CTkLabel
-            pil_img = Image.fromarray(frame_rgb)
-            ctk_img = ctk.CTkImage(light_image=pil_img, size=(940, 420))
-            
-            # Update the label with the new image (in the main thread)
-            self.root.after(0, lambda: self.image_label.configure(image=ctk_img))
-            
-            # Small delay to reduce CPU usage
-            time.sleep(0.03)  # ~30 FPS
+        # Check if we should trigger case number, only once the visitor is confirmed over several frames
+        visitor_present = channel.presence_tracker.update(face_in_zone)
+
+        if visitor_present and face_in_zone:
+            # The preview follows the camera the visitor is standing at
+            self.preview_channel = channel
+            if not self.face_detection_cooldown:
+                self.request_conversation(channel, face_signature(gray if gray is not None else frame, zone_face))
+
+        if channel is not self.preview_channel:
+            return
+        
+        # Scale once, straight to display size, then wrap the buffer for the preview without copying
+        display_rgb = self.next_display_buffer()
+        cv2.resize(frame_rgb, self.display_size, dst=display_rgb, interpolation=cv2.INTER_AREA)
+        pil_img = Image.frombuffer("RGB", self.display_size, display_rgb, "raw", "RGB", 0, 1)
+        
+        # Hand the frame to the main thread; an unshown older frame is simply replaced
+        self.preview_mailbox.publish(pil_img)
+
+    def render_preview(self):
+        """Recurring Tk callback that shows the newest frame posted by the detection thread"""
+        sequence, image, _ = self.preview_mailbox.get(self.preview_sequence, timeout=0)
+        if image is not None:
+            self.preview_sequence = sequence
+            self.image_label.show(image)
+        if self.is_running:
+            self.preview_job = self.root.after(15, self.render_preview)
 
     # ===================================================================================================
 
@@ -481,12 +743,13 @@ class HighCourt:
     def on_closing(self):
         """Release resources and close application."""
         self.is_running = False
+        if self.preview_job is not None:
+            self.root.after_cancel(self.preview_job)
         if self.reset_timer is not None:
             self.reset_timer.cancel()  # Cancel the timer
-        if self.detection_thread and self.detection_thread.is_alive():
-            self.detection_thread.join(timeout=1.0)
-        if self.cap is not None:
-            self.cap.release()
+        for channel in self.camera_channels:
+            channel.stop()
+        self.prewarmer.release()
         if pygame.mixer.get_init() is not None:
             pygame.mixer.quit()
         self.root.destroy()
@@ -496,7 +759,7 @@ class HighCourt:
         self.on_action_performed()
         self.password_window = ctk.CTkToplevel(self.root)
         self.password_window.title("Password Verification")
-        self.password_window.geometry("360x480")  # Increased height to accommodate new buttons
+        self.password_window.geometry("360x560")  # Increased height to accommodate new buttons
         self.password_window.resizable(False, False)
 
         # Keep the pop-up on top and grab focus
@@ -573,6 +836,21 @@ class HighCourt:
         )
         close_button.grid(row=0, column=1, padx=10, pady=5)
 
+        # Stats Button, opens the admin screen for the entered password
+        stats_button = ctk.CTkButton(
+            additional_buttons_frame,
+            text="Stats",
+            font=ctk.CTkFont(size=24, weight="bold"),
+            width=260,
+            height=60,
+            fg_color="navy",
+            border_width=2,
+            border_color="white",
+            corner_radius=10,
+            command=self.show_admin_screen
+        )
+        stats_button.grid(row=1, column=0, columnspan=2, padx=10, pady=5)
+
     def reset_password(self):
         """Reset the password field."""
         self.on_action_performed()
@@ -606,6 +884,65 @@ class HighCourt:
         else:
             messagebox.showwarning("Warning", "Password cannot be empty.")
 
+    def show_admin_screen(self):
+        """Verify the entered password and show latency percentiles and camera stats."""
+        self.on_action_performed()
+        password = self.password_var.get()
+        if not password or not any(password in user.values() for user in self.auth_data):
+            messagebox.showerror("Error", "Incorrect password.")
+            return
+        self.close_password_window()
+
+        self.admin_window = ctk.CTkToplevel(self.root)
+        self.admin_window.title("Kiosk Stats")
+        self.admin_window.geometry("720x560")
+        self.admin_window.grab_set()
+        self.admin_window.focus_force()
+
+        self.admin_text = ctk.CTkTextbox(self.admin_window, font=ctk.CTkFont(family="Courier", size=16))
+        self.admin_text.pack(fill="both", expand=True, padx=10, pady=10)
+
+        admin_buttons_frame = ctk.CTkFrame(self.admin_window, fg_color="transparent")
+        admin_buttons_frame.pack(pady=10)
+        ctk.CTkButton(admin_buttons_frame, text="Refresh", font=ctk.CTkFont(size=20, weight="bold"),
+                      width=120, height=50, fg_color="green", command=self.refresh_admin_screen).grid(row=0, column=0, padx=10)
+        ctk.CTkButton(admin_buttons_frame, text="Close", font=ctk.CTkFont(size=20, weight="bold"),
+                      width=120, height=50, fg_color="maroon", command=self.admin_window.destroy).grid(row=0, column=1, padx=10)
+
+        self.refresh_admin_screen()
+
+    def refresh_admin_screen(self):
+        """Fill the admin screen with the current latency percentiles and camera stats."""
+        self.on_action_performed()
+        lines = [f"Latency from camera frame (ms), {self.latency_tracer.sessions} sessions", ""]
+        lines.append(f"{'Stage':<20}{'count':>7}{'p50':>10}{'p90':>10}{'p99':>10}")
+        for stage, row in self.latency_tracer.percentiles().items():
+            lines.append(f"{stage:<20}{row['count']:>7}{row['p50']:>10.1f}{row['p90']:>10.1f}{row['p99']:>10.1f}")
+
+        # Text histograms; the tail of a stage is easier to see here than in three percentiles
+        for stage in TRACE_STAGES:
+            histogram = self.latency_tracer.histogram(stage, bins=8)
+            if histogram is None:
+                continue
+            counts, edges = histogram
+            lines += ["", f"{stage} (ms)"]
+            for count, low, high in zip(counts, edges, edges[1:]):
+                bar = "#" * round(40 * count / max(counts))
+                lines.append(f"{low:>9.1f} - {high:<9.1f}{bar} {count}")
+
+        lines += ["", "Cameras", ""]
+        for stats in self.camera_stats():
+            lines.append(json.dumps(stats))
+        lines += ["", "Returning visitors", "", json.dumps(self.visitor_cache.stats())]
+        lines += ["", "Pre-warm", "", json.dumps(self.prewarmer.stats())]
+        lines += ["", "TTS cache", "", json.dumps(self.tts_cache.stats())]
+        lines += ["", "Prompt pack", "", json.dumps(self.prompt_pack.stats())]
+
+        self.admin_text.configure(state="normal")
+        self.admin_text.delete("1.0", "end")
+        self.admin_text.insert("1.0", "\n".join(lines))
+        self.admin_text.configure(state="disabled")
+
     def load_auth_data(self):
         """Load authentication data from auth.json."""
         self.on_action_performed()
@@ -619,6 +956,15 @@ class HighCourt:
                 {"admin": "244466666"}
             ]
 
+    def load_kiosk_config(self):
+        """Load kiosk settings from kiosk_config.json."""
+        try:
+            with open("kiosk_config.json", "r", encoding="utf-8") as file:
+                self.kiosk_config = json.load(file)
+        except FileNotFoundError:
+            print("Kiosk config file not found. Using default settings.")
+            self.kiosk_config = {}
+
     def stop_application(self):
         self.on_action_performed()
         if not self.camera_pause:
@@ -649,6 +995,8 @@ class HighCourt:
             self.conversation_pause = False
             self.listen_pause = False
         self.face_detection_cooldown = False
+        self.visitor_cache.clear()
+        self.trigger_signature = None
 
         # Stop any ongoing audio playback
         if pygame.mixer.get_init() is not None:
@@ -906,15 +1254,13 @@ class HighCourt:
         self.conversation_pause = False
         self.listen_pause = False
         
-        BASE_URL = "http://192.168.1.12:8000/cases"
-
         # Check if the case details are already cached
         if hasattr(self, 'case_cache') and case_id in self.case_cache:
             case_details = self.case_cache[case_id]
         else:
             def get_case_details(case_id):
                 try:
-                    response = requests.get(f"{BASE_URL}/{case_id}")
+                    response = self.http_session.get(f"{BASE_URL}/{case_id}")
                     if response.status_code == 200:
                         return response.json()
                     else:
@@ -931,16 +1277,19 @@ class HighCourt:
                 self.case_cache[case_id] = case_details
 
         if case_details:
-            case_details_sentence = f"""
-            Your case details are as follows: Case Type - {case_details['case_type']}, Case Number - {case_details['case_no']}, and Filing Year - {case_details['case_year']}. 
-            The petitioner in this case is {case_details['petitioner_name']}, while the respondent is {case_details['respondent_name']}. 
-            The case is being represented by Advocate {case_details['advocate_name']}. Currently, the case status is {case_details['status']}. 
-            The next hearing is scheduled for {case_details['next_date']}. Thank you.
-            """
-            case_details_sentence = self.translate_text(case_details_sentence, source='en', target=lang)
-            self.speak_text(case_details_sentence, lang)
+            # Fixed phrases come from the prompt pack or TTS cache, only the field values are synthesized;
+            # if the readout cannot be put together, translate and speak the whole paragraph as before
+            if not self.speak_case_readout(case_details, lang):
+                case_details_sentence = f"""
+                Your case details are as follows: Case Type - {case_details['case_type']}, Case Number - {case_details['case_no']}, and Filing Year - {case_details['case_year']}. 
+                The petitioner in this case is {case_details['petitioner_name']}, while the respondent is {case_details['respondent_name']}. 
+                The case is being represented by Advocate {case_details['advocate_name']}. Currently, the case status is {case_details['status']}. 
+                The next hearing is scheduled for {case_details['next_date']}. Thank you.
+                """
+                case_details_sentence = self.translate_text(case_details_sentence, source='en', target=lang)
+                self.speak_sentences(case_details_sentence, lang)
         else:
-            self.speak_text("Case not found.", lang)
+            self.speak_text(self.prompt("case_not_found", lang), lang)
 
         self.update_table(case_details, lang=lang)
 
@@ -956,10 +1305,13 @@ class HighCourt:
             return
         
         key = (source, target)
-        if key not in self._translators:
-            self._translators[key] = GoogleTranslator(source=source, target=target)
         try:
-            return self._translators[key].translate(text)
+            with self._translator_lock:
+                if key not in self._translators:
+                    self._translators[key] = GoogleTranslator(source=source, target=target)
+                translated = self._translators[key].translate(text)
+            self.latency_tracer.mark("translation")
+            return translated
         except Exception as e:
             print(f"Translation error: {e}")
             return text
@@ -975,67 +1327,192 @@ class HighCourt:
             return 
         
         try:
-            # Remove the existing file if it exists
-            if os.path.exists("speech.mp3"):
-                os.remove("speech.mp3")
+            speech_file, speech_audio = self.speech_audio(text, lang)
+            if self.play_speech(text, lang, speech_file, speech_audio):
+                # Clean up pygame mixer
+                pygame.mixer.quit()
 
-            # Generate the speech file using gTTS
-            tts = gTTS(text=text, lang=lang)
-            tts.save("speech.mp3")
-
-            # Initialize pygame mixer if not already initialized
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
-
-            # Load the speech file into pygame mixer
-            pygame.mixer.music.load("speech.mp3")
-            pygame.mixer.music.play() # Play the audio
+        except Exception as e:
+            print(f"Text-to-speech error: {e}")
 
-            # Calculate the total duration of the audio
-            audio = pygame.mixer.Sound("speech.mp3")
-            total_duration = audio.get_length()
+    def speak_sentences(self, text, lang="pa"):
+        """
+        Speak a long text sentence by sentence.
+        The first sentence plays as soon as it is synthesized while the next ones are synthesized in the background.
+        """
+        self.on_action_performed()
 
-            # Split the text into words for real-time display
-            words = text.split()
-            num_words = len(words)
-            duration_per_word = total_duration / max(num_words, 1)  # Avoid division by zero
+        if self.speak_pause or text=='' or text is None or self.conversation_pause:
+            return
 
-            # Clear the subtitle label before starting
-            if self.root and self.subtitle_label.winfo_exists():
-                self.subtitle_label.configure(text="")
-                self.root.update()
+        sentences = split_sentences(text)
+        if len(sentences) <= 1:
+            self.speak_text(text, lang)
+            return
 
-            # Start time for tracking word display
-            start_time = time.time()
+        self.speak_pipeline(sentences, lang, lambda sentence: (sentence, *self.speech_audio(sentence, lang)))
 
-            # Display words in real-time as the audio plays
-            for word in words:
-                if self.speak_pause:
+    def speak_pipeline(self, pieces, lang, render, cache=True):
+        """
+        Play pieces one after another while the next ones are rendered in the background.
+        render(piece) returns (text, speech_file, speech_audio) for play_speech.
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            futures = [executor.submit(render, piece) for piece in pieces]
+            for future in futures:
+                text, speech_file, speech_audio = future.result()
+                if self.speak_pause or self.conversation_pause:
                     return
-                
-                if self.root and self.subtitle_label.winfo_exists():
-                    # Append the current word to the subtitle label
-                    current_text = self.subtitle_label.cget("text")
-                    self.subtitle_label.configure(text=current_text + " " + word)
-                    self.root.update()
-
-                # Calculate the elapsed time and sleep accordingly
-                elapsed_time = time.time() - start_time
-                expected_time = duration_per_word * (words.index(word) + 1)
-                sleep_time = max(0, expected_time - elapsed_time)
-                time.sleep(sleep_time)
-
-            # Wait for the audio to finish playing
-            while pygame.mixer.music.get_busy():
-                if self.speak_pause:
+                if not self.play_speech(text, lang, speech_file, speech_audio, cache):
                     return
-                pygame.time.Clock().tick(10)  # Limit the loop to 10 FPS to reduce CPU usage
 
             # Clean up pygame mixer
             pygame.mixer.quit()
 
         except Exception as e:
             print(f"Text-to-speech error: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def speak_case_readout(self, case_details, lang="pa"):
+        """
+        Speak the case details sentence by sentence from the readout template, joining the audio of the fixed fragments and field values.
+        Returns False if readouts are unavailable (pydub without ffmpeg), so the caller can fall back.
+        """
+        self.on_action_performed()
+
+        if not self.readout_audio:
+            return False
+        if self.speak_pause or self.conversation_pause:
+            return True
+
+        # Party names and the like stay off the disk cache; it only keeps the fixed fragments
+        self.speak_pipeline(CASE_READOUT, lang, lambda sentence: self.readout_sentence_audio(sentence, case_details, lang),
+                            cache=False)
+        return True
+
+    def readout_sentence_audio(self, sentence, case_details, lang):
+        """Return (text, speech_file, speech_audio) for one readout sentence"""
+        parts = readout_parts(sentence, case_details, lang, self.prompt,
+                              lambda text: self.translate_text(text, source='en', target=lang))
+        text = " ".join(part for _, part in parts)
+
+        # Fixed fragments from the prompt pack or TTS cache, field values synthesized in memory only
+        segments = [self.fragment_speech_file(part, lang) if kind == "prompt" else self.synthesize_speech(part, lang)
+                    for kind, part in parts]
+        if len(segments) == 1:
+            segment = segments[0]
+            return (text, None, segment) if isinstance(segment, bytes) else (text, segment, None)
+        return text, None, join_speech(segments)
+
+    def fragment_speech_file(self, text, lang):
+        """Audio file for one fixed readout fragment: from the prompt pack, or the TTS cache filled on a miss"""
+        return self.prompt_pack.speech_file(text, lang) or self.tts_cache.speech_file(
+            text, lang, lambda: self.synthesize_speech(text, lang))
+
+    def speech_audio(self, text, lang):
+        """Return (speech_file, speech_audio) for text: a file to stream, or MP3 bytes synthesized just now"""
+        # Fixed prompts come from the prompt pack, anything said before from the TTS cache
+        speech_file = self.prompt_pack.speech_file(text, lang) or self.tts_cache.lookup(text, lang)
+        if speech_file is not None:
+            return speech_file, None
+
+        # Synthesize into memory and play from there; the cache copy is written once playback runs
+        speech_audio = self.synthesize_speech(text, lang)
+        self.latency_tracer.mark("synthesis")
+        return None, speech_audio
+
+    def play_speech(self, text, lang, speech_file, speech_audio, cache=True):
+        """
+        Play one piece of speech with word-by-word subtitles; returns False if speaking was paused.
+        Synthesized speech_audio is added to the TTS cache unless cache is False.
+        """
+        # Duration from the MP3 header, without decoding the audio
+        total_duration = MP3(speech_file or io.BytesIO(speech_audio)).info.length
+
+        # Initialize pygame mixer if not already initialized
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+        # Load the speech into pygame mixer, streamed from the file or the in-memory buffer
+        speech_source = speech_file or io.BytesIO(speech_audio)
+        pygame.mixer.music.load(speech_source, "mp3")
+        pygame.mixer.music.play() # Play the audio
+        self.latency_tracer.mark("mixer_start")
+
+        if speech_audio is not None and cache:
+            try:
+                self.tts_cache.store(text, lang, speech_audio)
+            except OSError as e:
+                print(f"TTS cache error: {e}")
+
+        # Split the text into words for real-time display
+        words = text.split()
+        num_words = len(words)
+        duration_per_word = total_duration / max(num_words, 1)  # Avoid division by zero
+
+        # Clear the subtitle label before starting
+        if self.root and self.subtitle_label.winfo_exists():
+            self.subtitle_label.configure(text="")
+            self.root.update()
+
+        # Start time for tracking word display
+        start_time = time.time()
+
+        # Display words in real-time as the audio plays
+        for word in words:
+            if self.speak_pause:
+                return False
+            
+            if self.root and self.subtitle_label.winfo_exists():
+                # Append the current word to the subtitle label
+                current_text = self.subtitle_label.cget("text")
+                self.subtitle_label.configure(text=current_text + " " + word)
+                self.root.update()
+                self.latency_tracer.mark("first_word")
+
+            # Calculate the elapsed time and sleep accordingly
+            elapsed_time = time.time() - start_time
+            expected_time = duration_per_word * (words.index(word) + 1)
+            sleep_time = max(0, expected_time - elapsed_time)
+            time.sleep(sleep_time)
+
+        # Wait for the audio to finish playing
+        while pygame.mixer.music.get_busy():
+            if self.speak_pause:
+                return False
+            pygame.time.Clock().tick(10)  # Limit the loop to 10 FPS to reduce CPU usage
+
+        return True
+
+    def synthesize_speech(self, text, lang):
+        """Generate speech with gTTS and return the MP3 bytes"""
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang).write_to_fp(buffer)
+        return buffer.getvalue()
+
+    def prepare_greeting(self, lang="pa"):
+        """Render the language selection prompt ahead of time so it plays without a TTS round trip"""
+        text = self.prompt("language_menu", lang)
+        if text is None or self.prompt_pack.speech_file(text, lang) is not None:
+            return
+        self.tts_cache.speech_file(text, lang, lambda: self.synthesize_speech(text, lang))
+
+    def prompt(self, prompt_id, lang="pa"):
+        """Fixed conversation prompt in the given language, from the prompt pack or translated once"""
+        text = self.prompt_pack.text(prompt_id, lang)
+        if text is not None:
+            return text
+        if lang == 'en':
+            return PROMPTS[prompt_id]
+        if (prompt_id, lang) in self.prompt_texts:
+            return self.prompt_texts[(prompt_id, lang)]
+        translated = self.translate_text(PROMPTS[prompt_id], source='en', target=lang)
+        # translate_text hands back the English text when translation fails; try again next time
+        if translated is not None and translated != PROMPTS[prompt_id]:
+            self.prompt_texts[(prompt_id, lang)] = translated
+        return translated
 
     def listen(self, lang="pa"):
         """Listen for user input and return the recognized text."""
@@ -1044,12 +1521,19 @@ class HighCourt:
         if self.listen_pause:
             return
 
-        recognizer = sr.Recognizer()
+        # A microphone opened and calibrated while the visitor was approaching skips the calibration second
+        prewarmed = self.prewarmer.microphone()
+        if prewarmed is not None:
+            recognizer, microphone = prewarmed
+        else:
+            recognizer = sr.Recognizer()
+            microphone = sr.Microphone()
 
-        with sr.Microphone() as source:
+        with microphone as source:
             try:
                 winsound.PlaySound(self.start_sound, winsound.SND_FILENAME)
-                recognizer.adjust_for_ambient_noise(source)
+                if prewarmed is None:
+                    recognizer.adjust_for_ambient_noise(source)
                 self.subtitle_label.configure(text="Listening...")
                 self.root.update()
 
@@ -1322,6 +1806,7 @@ class HighCourt:
     def face_mic_conversation(self):
         """Prompt the user for case number after face detection"""
         self.on_action_performed()
+        self.latency_tracer.mark("conversation_start")
         
         self.camera_pause = True
         self.speak_pause = False
@@ -1329,9 +1814,12 @@ class HighCourt:
         self.listen_pause = False
 
         self.conversation(lang='pa', input_from_button=False)
+        self.prewarmer.release()
+        self.latency_tracer.finish()
 
         # Reset the face_detection_cooldown flag after the conversation
         self.face_detection_cooldown = False
+        self.face_detected = False
 
         self.camera_pause = False
 
@@ -1353,49 +1841,32 @@ class HighCourt:
                 else:
                     selected_lang = 'punjabi'
             else:
-                prompt_lang = "Kindly select a language. I could understand three languages, Punjabi, English and Hindi. Speak anyone of them."
-
-                prompt_lang = self.translate_text(prompt_lang, source='en', target=lang)
+                prompt_lang = self.prompt("language_menu", lang)
                 self.speak_text(prompt_lang, lang=lang)
                 selected_lang = self.listen(lang='en')
 
+                # Nobody answered a face-triggered prompt: most likely a passer-by
+                if not selected_lang and self.face_detected and self.trigger_channel is not None:
+                    self.trigger_channel.presence_tracker.record_false_trigger()
+                # Only a visitor who actually answered counts as served
+                if selected_lang and self.trigger_signature is not None:
+                    self.visitor_cache.remember(self.trigger_signature)
+                self.trigger_signature = None
+
             # Handle the case where selected_lang is None
             if selected_lang is None:
-                self.speak_text(self.translate_text("I couldn't understand your language selection. Please try again.", source='en', target=lang), lang=lang)
+                self.speak_text(self.prompt("language_not_understood", lang), lang=lang)
                 return
 
             if 'english' in selected_lang.lower() and not self.conversation_pause:
-                prompt_text = """
-                    Congrates you selected english language.
-                    Kindly tell me, how would you like to get the details?
-                    1. Case Search
-                    2. Judgment Search
-                    3. Filing Search
-                """
                 lang = 'en'
-                self.speak_text(prompt_text, lang=lang)
+                self.speak_text(self.prompt("selected_english", lang), lang=lang)
             elif 'punjabi' in selected_lang.lower() and not self.conversation_pause:
-                prompt_text = """
-                    Congrates you selected punjabi language.
-                    Kindly tell me, how would you like to get the details?
-                    1. Case Search
-                    2. Judgment Search
-                    3. Filing Search
-                """
                 lang = 'pa'
-                translated_prompt = self.translate_text(prompt_text, source="en", target=lang)
-                self.speak_text(translated_prompt, lang=lang)
+                self.speak_text(self.prompt("selected_punjabi", lang), lang=lang)
             elif 'hindi' in selected_lang.lower() and not self.conversation_pause:
-                prompt_text = """
-                    Congrates you selected hindi language.
-                    Kindly tell me, how would you like to get the details?
-                    1. Case Search
-                    2. Judgment Search
-                    3. Filing Search
-                """
                 lang = 'hi'
-                translated_prompt = self.translate_text(prompt_text, source="en", target=lang)
-                self.speak_text(translated_prompt, lang=lang)
+                self.speak_text(self.prompt("selected_hindi", lang), lang=lang)
             else:
                 return
             
@@ -1414,18 +1885,18 @@ class HighCourt:
                     search_type = 'filing search'
                 else:
                     print("No match found.")
-                    self.speak_text(self.translate_text("No valid search type recognized. Please try again.", source='en', target=lang), lang=lang)
+                    self.speak_text(self.prompt("search_type_not_recognized", lang), lang=lang)
                     return  
             else:
-                self.speak_text(self.translate_text("I couldn't understand your input. Please try again.", source='en', target=lang), lang=lang)
+                self.speak_text(self.prompt("input_not_understood", lang), lang=lang)
                 return
             
-            self.speak_text(self.translate_text(f"Ok. You want to make a search by {search_type}.", source='en', target=lang), lang=lang)
+            self.speak_text(self.prompt("search_by_" + search_type.split()[0], lang), lang=lang)
 
             search_type = "case search"  # remove it later
 
             if search_type == 'case search':
-                self.speak_text(self.translate_text("Kindly speak case number. ", source='en', target=lang), lang=lang)
+                self.speak_text(self.prompt("speak_case_number", lang), lang=lang)
                 case_id = self.listen_case_id(case_types, lang=lang)
                 
                 if case_id:
@@ -1434,7 +1905,7 @@ class HighCourt:
                     self.root.update()
                     self.process_case_details(case_id, lang=lang, input_from_button=False)
             else:
-                self.speak_text(self.translate_text("No valid case ID recognized. Please try again.", source='en', target=lang), lang=lang)
+                self.speak_text(self.prompt("case_id_not_recognized", lang), lang=lang)
             
             self.camera_pause = False
         
@@ -0,0 +1,187 @@
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from camera_capture import FrameRateGovernor, open_frame_source
+from face_detection import create_face_pipeline
+
+# Largest frame a ring slot has to hold; some webcams ignore the requested resolution
+MAX_FRAME_SIZE = (1920, 1080)
+
+
+# ========================================= shared frame ring =======================================
+class SharedFrameRing:
+    """Fixed number of frame slots in multiprocessing.shared_memory.
+
+    The worker writes a frame into the next slot and then tells the UI which
+    slot and shape to read, so frames never go through a pipe. Which slots
+    the worker may overwrite is decided by DetectionProcess, see get().
+    """
+
+    def __init__(self, slot_bytes, slots=4, name=None):
+        self.slot_bytes = slot_bytes
+        self.slots = slots
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=slot_bytes * slots)
+        self.name = self.shm.name
+        self.buffer = np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=self.shm.buf)
+
+    def write(self, slot, frame):
+        data = np.ascontiguousarray(frame).reshape(-1)
+        if data.size > self.slot_bytes:
+            raise ValueError(f"Frame of {data.size} bytes does not fit a {self.slot_bytes} byte slot")
+        self.buffer[slot, :data.size] = data
+
+    def view(self, slot, shape):
+        """Frame stored in a slot, without copying it out of shared memory."""
+        size = int(np.prod(shape))
+        return self.buffer[slot, :size].reshape(shape)
+
+    def close(self):
+        del self.buffer
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+# ===================================================================================================
+
+# ========================================= worker process ==========================================
+def run_detection_worker(ring_name, slot_bytes, slots, config, results, paused, running,
+                         slot_sequences, reading_slot, camera_index=0):
+    """Capture and detect faces in a separate process.
+
+    Only (sequence, slot, shape, frame_time, faces, detected, detection_ms, pipeline_stats) tuples
+    go back to the UI; the frame itself is left in the shared ring. The slot the UI is reading
+    (reading_slot) is never written, and slot_sequences holds the frame
+    sequence in each slot, -1 while it is being written.
+    """
+    ring = SharedFrameRing(slot_bytes, slots, name=ring_name)
+    camera = open_frame_source(camera_index, config, realtime=config.get("replay_realtime", True))
+    camera.start()
+    pipeline = create_face_pipeline(config)
+    governor = FrameRateGovernor(
+        target_fps=config.get("target_fps", 30.0),
+        min_fps=config.get("min_fps", 10.0),
+        adaptive=config.get("adaptive_fps", True)
+    )
+
+    frame_sequence = 0
+    slot = 0
+    try:
+        while running.is_set():
+            frame_sequence, frame, frame_time = camera.read(frame_sequence, timeout=0.5)
+            if frame is None or paused.value:
+                # Tracks go stale while paused, start again from a full detection
+                pipeline.reset()
+                governor.idle()
+                continue
+
+            governor.begin_frame()
+            detection_start = time.perf_counter()
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            faces, _, active = pipeline.process(gray, run_detector=not camera.power.is_idle(), frame=frame)
+            if active:
+                camera.power.activity()
+            else:
+                camera.power.update()
+            detection_ms = (time.perf_counter() - detection_start) * 1000.0
+
+            with reading_slot.get_lock():
+                slot = (slot + 1) % slots
+                if slot == reading_slot.value:
+                    slot = (slot + 1) % slots
+                slot_sequences[slot] = -1
+            try:
+                ring.write(slot, frame)
+            except ValueError as e:
+                print(f"Detection worker: {e}")
+                continue
+            slot_sequences[slot] = frame_sequence
+
+            faces = [tuple(int(v) for v in face) for face in faces]
+            message = (frame_sequence, slot, frame.shape, frame_time, faces, pipeline.detected, detection_ms,
+                       pipeline.stats())
+            try:
+                results.put_nowait(message)
+            except queue.Full:
+                # The UI is behind and only wants the newest result: drop the oldest one instead
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    pass  # The UI took it in the meantime
+                try:
+                    results.put_nowait(message)
+                except queue.Full:
+                    pass
+            governor.end_frame()
+    finally:
+        camera.stop()
+        ring.close()
+
+
+class DetectionProcess:
+    """UI-side handle for the detection worker process."""
+
+    def __init__(self, config, camera_index=0, slots=4):
+        width, height = config.get("max_frame_size", MAX_FRAME_SIZE)
+        self.config = config
+        self.camera_index = camera_index
+        self.ring = SharedFrameRing(width * height * 3, slots)
+        self.results = mp.Queue(maxsize=2)
+        self.slot_sequences = mp.Array("q", [-1] * slots)  # Frame sequence held by each slot
+        self.reading_slot = mp.Value("i", -1)  # Slot the UI is reading; its lock also guards slot_sequences
+        self.paused = mp.Value("b", False)
+        self.running = mp.Event()
+        self.process = None
+        self.pipeline_stats = {}  # FacePipeline.stats() of the worker, from its newest result
+
+    def start(self):
+        self.running.set()
+        self.process = mp.Process(
+            target=run_detection_worker,
+            args=(self.ring.name, self.ring.slot_bytes, self.ring.slots, self.config,
+                  self.results, self.paused, self.running, self.slot_sequences, self.reading_slot,
+                  self.camera_index)
+        )
+        self.process.daemon = True
+        self.process.start()
+
+    def set_paused(self, paused):
+        self.paused.value = bool(paused)
+
+    def get(self, timeout=0.5):
+        """Return the newest (sequence, frame, frame_time, faces, detected, detection_ms), or None on timeout.
+
+        detected is True when the faces come from the full detector rather than the tracker.
+
+        frame is a view into shared memory. Its slot stays reserved for the UI,
+        and the worker leaves it alone until the next get(). A result whose
+        slot was overwritten before it could be reserved is dropped.
+        """
+        try:
+            message = self.results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        while True:
+            try:
+                message = self.results.get_nowait()
+            except queue.Empty:
+                break
+        sequence, slot, shape, frame_time, faces, detected, detection_ms, self.pipeline_stats = message
+        with self.reading_slot.get_lock():
+            if self.slot_sequences[slot] != sequence:
+                return None
+            self.reading_slot.value = slot
+        return sequence, self.ring.view(slot, shape), frame_time, faces, detected, detection_ms
+
+    def stop(self, timeout=1.0):
+        self.running.clear()
+        if self.process is not None:
+            self.process.join(timeout=timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.ring.close()
+# ===================================================================================================
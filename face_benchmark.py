@@ -0,0 +1,167 @@
+import argparse
+import itertools
+import json
+import os
+import time
+
+import cv2
+
+from face_detection import (DETECTION_SCALE, DETECTION_ZONE, FACE_IN_RANGE, HAAR_CASCADE, MAX_FACE_SIZE, MIN_FACE_SIZE,
+                            HaarDetector, classify_faces, detect_faces_in_zone, detect_faces_scaled, detection_zone)
+
+# A detection counts as finding a labelled face when the boxes overlap this much
+MATCH_IOU = 0.5
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+# ========================================= corpus ==================================================
+def load_corpus(path, labels_file="labels.json"):
+    """Load a labelled frame corpus as a list of (name, gray, faces).
+
+    The directory holds the frames and a labels.json mapping each file name to
+    the faces that should start a conversation, as [x, y, w, h] boxes. Frames
+    with an empty list (or missing from labels.json) are negatives: nobody at
+    the kiosk, a passer-by, a face too far away.
+    """
+    labels_path = os.path.join(path, labels_file)
+    try:
+        with open(labels_path, "r", encoding="utf-8") as file:
+            labels = json.load(file)
+    except FileNotFoundError:
+        print(f"{labels_path} not found. Treating every frame as a negative.")
+        labels = {}
+
+    corpus = []
+    for name in sorted(os.listdir(path)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        gray = cv2.imread(os.path.join(path, name), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            print(f"Could not read image: {name}")
+            continue
+        faces = [tuple(int(v) for v in face) for face in labels.get(name, [])]
+        corpus.append((name, gray, faces))
+    return corpus
+# ===================================================================================================
+
+# ========================================= scoring =================================================
+def box_iou(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    overlap_w = min(ax + aw, bx + bw) - max(ax, bx)
+    overlap_h = min(ay + ah, by + bh) - max(ay, by)
+    if overlap_w <= 0 or overlap_h <= 0:
+        return 0.0
+    overlap = overlap_w * overlap_h
+    return overlap / float(aw * ah + bw * bh - overlap)
+
+
+def triggering_faces(faces, zone_rect, min_face_size, max_face_size):
+    """Faces the kiosk would start a conversation for: centred in the zone and within the size limits."""
+    boxes, status, _ = classify_faces(faces, zone_rect, min_face_size, max_face_size)
+    return [tuple(box) for box in boxes[status == FACE_IN_RANGE].tolist()]
+
+
+def run_setting(corpus, setting, zone=DETECTION_ZONE, zone_crop_detection=True):
+    """Run one parameter setting over the corpus and score it."""
+    cv2.setNumThreads(setting["threads"])
+    detector = HaarDetector(
+        HAAR_CASCADE,
+        scale_factor=setting["scale_factor"],
+        min_neighbors=setting["min_neighbors"]
+    )
+    min_face_size = (setting["min_face"], setting["min_face"])
+    max_face_size = (setting["max_face"], setting["max_face"])
+
+    total_ms = 0.0
+    labelled = 0
+    found = 0
+    negative_frames = 0
+    false_triggers = 0
+
+    for _, gray, labels in corpus:
+        height, width = gray.shape[:2]
+        zone_rect = detection_zone(width, height, zone)
+
+        start = time.perf_counter()
+        if zone_crop_detection:
+            faces = detect_faces_in_zone(detector, gray, zone_rect, min_face_size, max_face_size,
+                                         detection_scale=setting["detection_scale"])
+        else:
+            faces = detect_faces_scaled(detector, gray, min_face_size, max_face_size,
+                                        detection_scale=setting["detection_scale"])
+        total_ms += (time.perf_counter() - start) * 1000.0
+
+        triggers = triggering_faces(faces, zone_rect, min_face_size, max_face_size)
+        labelled += len(labels)
+        found += sum(1 for label in labels if any(box_iou(label, face) >= MATCH_IOU for face in triggers))
+        if not labels:
+            negative_frames += 1
+            if triggers:
+                false_triggers += 1
+
+    result = dict(setting)
+    result["ms_per_frame"] = round(total_ms / max(len(corpus), 1), 2)
+    result["recall"] = round(found / labelled, 3) if labelled else None
+    result["false_trigger_rate"] = round(false_triggers / negative_frames, 3) if negative_frames else None
+    return result
+# ===================================================================================================
+
+# ========================================= sweep ===================================================
+def parameter_grid(scale_factors, min_neighbors, min_faces, max_faces, detection_scales, threads):
+    for values in itertools.product(scale_factors, min_neighbors, min_faces, max_faces, detection_scales, threads):
+        setting = dict(zip(("scale_factor", "min_neighbors", "min_face", "max_face", "detection_scale", "threads"), values))
+        if setting["min_face"] < setting["max_face"]:
+            yield setting
+
+
+def print_table(results):
+    header = f"{'scale':>6}{'neigh':>6}{'min':>6}{'max':>6}{'res':>6}{'thr':>5}{'ms/frame':>10}{'recall':>8}{'false trig':>12}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        recall = "-" if r["recall"] is None else f"{r['recall']:.3f}"
+        false_rate = "-" if r["false_trigger_rate"] is None else f"{r['false_trigger_rate']:.3f}"
+        print(f"{r['scale_factor']:>6}{r['min_neighbors']:>6}{r['min_face']:>6}{r['max_face']:>6}"
+              f"{r['detection_scale']:>6}{r['threads']:>5}{r['ms_per_frame']:>10.2f}{recall:>8}{false_rate:>12}")
+# ===================================================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the kiosk face detector over a grid of parameters.")
+    parser.add_argument("corpus", help="directory of frames with a labels.json")
+    parser.add_argument("--scale-factors", type=float, nargs="+", default=[1.05, 1.1, 1.2, 1.3])
+    parser.add_argument("--min-neighbors", type=int, nargs="+", default=[3, 5, 7])
+    parser.add_argument("--min-faces", type=int, nargs="+", default=[MIN_FACE_SIZE[0]])
+    parser.add_argument("--max-faces", type=int, nargs="+", default=[MAX_FACE_SIZE[0]])
+    parser.add_argument("--detection-scales", type=float, nargs="+", default=[0.25, DETECTION_SCALE, 1.0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[cv2.getNumThreads()],
+                        help="values for cv2.setNumThreads")
+    parser.add_argument("--full-frame", action="store_true", help="run the detector on the whole frame instead of the zone")
+    parser.add_argument("--sort", default="ms_per_frame", choices=["ms_per_frame", "recall", "false_trigger_rate"])
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"No frames found in {args.corpus}")
+        return
+    print(f"{len(corpus)} frames, {sum(len(faces) for _, _, faces in corpus)} labelled faces")
+
+    grid = parameter_grid(args.scale_factors, args.min_neighbors, args.min_faces, args.max_faces,
+                          args.detection_scales, args.threads)
+    results = [run_setting(corpus, setting, zone_crop_detection=not args.full_frame) for setting in grid]
+
+    # Best first: fastest, highest recall, fewest false triggers
+    sign = -1 if args.sort == "recall" else 1
+    results.sort(key=lambda r: (r[args.sort] is None, sign * (r[args.sort] or 0)))
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,741 @@
+import os
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+# Default detection resolution, as a fraction of the camera frame.
+# The kiosk only triggers on faces of 160-240 px, so half resolution is still
+# far above the cascade's 24 px window and costs about a quarter of the work.
+DETECTION_SCALE = 0.5
+
+# Detection zone as fractions of the frame: (x_start, x_end, y_start, y_end).
+# A face only counts when its centre falls inside this box.
+DETECTION_ZONE = (0.3, 0.7, 0.2, 0.8)
+
+# Faces are only accepted between these sizes, which roughly puts the visitor
+# at arm's length from the kiosk camera.
+MIN_FACE_SIZE = (160, 160)
+MAX_FACE_SIZE = (240, 240)
+
+# The detector looks for faces down to this fraction of MIN_FACE_SIZE, so a
+# visitor still too far away is seen while walking up; only MIN_FACE_SIZE and
+# larger trigger a conversation (classify_faces)
+APPROACH_FACE_SCALE = 0.6
+
+# Extra pixels around the half-face margin of the zone crop, for boxes that
+# come back slightly larger than the face
+ZONE_MARGIN_SLACK = 8
+
+
+# ========================================= detection zone ==========================================
+def detection_zone(width, height, zone=DETECTION_ZONE):
+    """Return the detection zone in pixels as (x_start, y_start, x_end, y_end)."""
+    return (int(width * zone[0]), int(height * zone[2]), int(width * zone[1]), int(height * zone[3]))
+
+def zone_search_area(zone_rect, width, height, margin):
+    """Grow the zone by a margin on every side, clipped to the frame.
+
+    A face whose centre sits on the zone edge still extends past it by half
+    its size, so the detector has to see the zone plus half a face on each side.
+    """
+    x_start, y_start, x_end, y_end = zone_rect
+    return (max(0, x_start - margin), max(0, y_start - margin),
+            min(width, x_end + margin), min(height, y_end + margin))
+
+def in_zone(face, zone_rect):
+    """Check whether the centre of a face box lies inside the zone."""
+    x, y, w, h = face
+    x_start, y_start, x_end, y_end = zone_rect
+    face_center_x = x + w // 2
+    face_center_y = y + h // 2
+    return x_start < face_center_x < x_end and y_start < face_center_y < y_end
+
+# Face status codes returned by classify_faces
+FACE_IN_RANGE, FACE_TOO_FAR, FACE_TOO_CLOSE, FACE_OUT_OF_ZONE = range(4)
+
+def classify_faces(faces, zone_rect, min_face_size, max_face_size):
+    """Classify every face box at once against the zone and the size limits.
+
+    Returns (boxes, status, sizes): an (n, 4) int array of boxes, their FACE_*
+    status codes and their sizes in pixels (the larger of width and height).
+    """
+    boxes = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
+    sizes = boxes[:, 2:].max(axis=1)
+    centers = boxes[:, :2] + boxes[:, 2:] // 2
+    x_start, y_start, x_end, y_end = zone_rect
+    inside = ((x_start < centers[:, 0]) & (centers[:, 0] < x_end) &
+              (y_start < centers[:, 1]) & (centers[:, 1] < y_end))
+
+    status = np.full(len(boxes), FACE_OUT_OF_ZONE, dtype=np.int8)
+    status[inside] = FACE_IN_RANGE
+    status[inside & (sizes < min_face_size[0])] = FACE_TOO_FAR
+    status[inside & (sizes > max_face_size[0])] = FACE_TOO_CLOSE
+    return boxes, status, sizes
+# ===================================================================================================
+
+# ========================================= detector backends =======================================
+# Model files of the optional backends, relative to the application directory. They are not
+# part of the repository; fetch_models.py downloads them (YuNet from opencv_zoo, the LBP
+# cascade from the OpenCV sources) and with --check runs every backend once
+YUNET_MODEL = os.path.join("models", "face_detection_yunet_2023mar.onnx")
+LBP_CASCADE = os.path.join("models", "lbpcascade_frontalface_improved.xml")
+HAAR_CASCADE = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+
+
+class FaceDetector:
+    """Common interface for the face detector backends.
+
+    detect() takes a grayscale image and returns a list of (x, y, w, h) boxes
+    within the size limits, and records how long the backend took. Backends
+    with color = True are given the BGR frame instead.
+    """
+
+    name = "base"
+    color = False
+
+    def __init__(self):
+        self.last_latency = 0.0   # ms for the most recent frame
+        self.mean_latency = 0.0   # running average in ms
+        self.frames = 0
+
+    def detect(self, gray, min_face_size, max_face_size):
+        start = time.perf_counter()
+        faces = self._detect(gray, min_face_size, max_face_size)
+        self.last_latency = (time.perf_counter() - start) * 1000.0
+        self.frames += 1
+        self.mean_latency += (self.last_latency - self.mean_latency) / self.frames
+        return faces
+
+    def _detect(self, gray, min_face_size, max_face_size):
+        raise NotImplementedError
+
+    def stats(self):
+        return {
+            "backend": self.name,
+            "frames": self.frames,
+            "last_latency_ms": round(self.last_latency, 2),
+            "mean_latency_ms": round(self.mean_latency, 2),
+        }
+
+
+class HaarDetector(FaceDetector):
+    """Viola-Jones cascade, the detector the kiosk has always used."""
+
+    name = "haar"
+
+    def __init__(self, cascade_path=HAAR_CASCADE, scale_factor=1.1, min_neighbors=5, cascade=None):
+        super().__init__()
+        self.cascade = cascade if cascade is not None else cv2.CascadeClassifier(cascade_path)
+        if self.cascade.empty():
+            raise ValueError(f"Could not load cascade: {cascade_path}")
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+
+    def _detect(self, gray, min_face_size, max_face_size):
+        faces = self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=min_face_size,
+            maxSize=max_face_size
+        )
+        return [tuple(int(v) for v in face) for face in faces]
+
+
+class LbpDetector(HaarDetector):
+    """Local binary pattern cascade, faster than Haar at some cost in accuracy."""
+
+    name = "lbp"
+
+    def __init__(self, cascade_path=LBP_CASCADE, scale_factor=1.1, min_neighbors=5):
+        super().__init__(cascade_path, scale_factor, min_neighbors)
+
+
+class YuNetDetector(FaceDetector):
+    """OpenCV YuNet DNN face detector (cv2.FaceDetectorYN)."""
+
+    name = "yunet"
+    color = True  # The network is trained on colour images
+
+    def __init__(self, model_path=YUNET_MODEL, score_threshold=0.8, nms_threshold=0.3):
+        super().__init__()
+        if not os.path.exists(model_path):
+            raise ValueError(f"YuNet model not found: {model_path}. Run fetch_models.py to download it.")
+        self.detector = cv2.FaceDetectorYN.create(model_path, "", (320, 320), score_threshold, nms_threshold)
+        self.input_size = (320, 320)
+
+    def _detect(self, image, min_face_size, max_face_size):
+        if image.ndim == 2:
+            # Only a grayscale image was available; the network still needs three channels
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        height, width = image.shape[:2]
+        if (width, height) != self.input_size:
+            self.detector.setInputSize((width, height))
+            self.input_size = (width, height)
+
+        _, detections = self.detector.detect(image)
+        if detections is None:
+            return []
+
+        faces = []
+        for detection in detections:
+            x, y, w, h = (int(v) for v in detection[:4])
+            size = max(w, h)
+            if min_face_size[0] <= size <= max_face_size[0]:
+                faces.append((x, y, w, h))
+        return faces
+
+
+FACE_DETECTORS = {
+    "haar": HaarDetector,
+    "lbp": LbpDetector,
+    "yunet": YuNetDetector,
+}
+
+
+def create_face_detector(name="haar", **options):
+    """Create a detector backend by name.
+
+    A backend that is configured but cannot be loaded (unknown name, missing
+    model file) raises ValueError instead of quietly running a different one.
+    """
+    if name not in FACE_DETECTORS:
+        raise ValueError(f"Unknown face detector '{name}'. Choose one of: {', '.join(FACE_DETECTORS)}")
+    try:
+        return FACE_DETECTORS[name](**options)
+    except cv2.error as e:
+        raise ValueError(f"Face detector '{name}' could not be loaded: {e}") from e
+# ===================================================================================================
+
+# ========================================= face detection ==========================================
+def detect_faces_scaled(face_detector, gray, min_face_size, max_face_size,
+                        detection_scale=DETECTION_SCALE, scale_factor=1.1, min_neighbors=5):
+    """Run the detector on a downscaled copy of the frame and return boxes in full-frame coordinates.
+
+    face_detector is a FaceDetector backend; a bare cv2.CascadeClassifier is also
+    accepted and run with scale_factor and min_neighbors.
+    """
+    if not isinstance(face_detector, FaceDetector):
+        face_detector = HaarDetector(scale_factor=scale_factor, min_neighbors=min_neighbors, cascade=face_detector)
+
+    if detection_scale >= 1.0:
+        return face_detector.detect(gray, min_face_size, max_face_size)
+
+    small = cv2.resize(gray, None, fx=detection_scale, fy=detection_scale, interpolation=cv2.INTER_AREA)
+
+    # Round the limits outwards so a face right on the edge of the range is not lost to rounding
+    small_min = (int(min_face_size[0] * detection_scale), int(min_face_size[1] * detection_scale))
+    small_max = (int(max_face_size[0] * detection_scale + 0.5) + 1, int(max_face_size[1] * detection_scale + 0.5) + 1)
+
+    faces = face_detector.detect(small, small_min, small_max)
+
+    # Map the boxes back to the full-resolution frame for the overlay and zone checks
+    return [
+        (int(round(x / detection_scale)), int(round(y / detection_scale)),
+         int(round(w / detection_scale)), int(round(h / detection_scale)))
+        for (x, y, w, h) in faces
+    ]
+
+def detect_faces_in_zone(face_detector, gray, zone_rect, min_face_size, max_face_size,
+                         detection_scale=DETECTION_SCALE, scale_factor=1.1, min_neighbors=5):
+    """Run the detector only on the detection zone plus a half-face margin.
+
+    Boxes are returned in full-frame coordinates, so a smaller zone directly
+    means fewer pixels for the cascade to scan.
+    """
+    height, width = gray.shape[:2]
+    # Only faces centred in the zone count, so at most half of one sticks out
+    margin = max(max_face_size) // 2 + ZONE_MARGIN_SLACK
+    x0, y0, x1, y1 = zone_search_area(zone_rect, width, height, margin)
+    if x1 - x0 < min_face_size[0] or y1 - y0 < min_face_size[1]:
+        return []
+
+    faces = detect_faces_scaled(
+        face_detector,
+        gray[y0:y1, x0:x1],
+        min_face_size,
+        max_face_size,
+        detection_scale=detection_scale,
+        scale_factor=scale_factor,
+        min_neighbors=min_neighbors
+    )
+    return [(x + x0, y + y0, w, h) for (x, y, w, h) in faces]
+# ===================================================================================================
+
+# ========================================= face tracking ===========================================
+class TemplateTracker:
+    """Follow face boxes between detector runs by template matching around the last box."""
+
+    def __init__(self, tracking_scale=0.25, search_margin=0.5):
+        self.tracking_scale = tracking_scale  # Tracking runs on a small copy of the frame
+        self.search_margin = search_margin    # Search window grows the last box by this fraction
+        self.tracks = []                      # (template, (x, y, w, h)) in tracking coordinates
+
+    def _shrink(self, gray):
+        return cv2.resize(gray, None, fx=self.tracking_scale, fy=self.tracking_scale, interpolation=cv2.INTER_AREA)
+
+    def start(self, gray, faces):
+        """Take fresh templates from the boxes the detector just returned."""
+        small = self._shrink(gray)
+        s = self.tracking_scale
+        self.tracks = []
+        for (x, y, w, h) in faces:
+            box = (int(x * s), int(y * s), max(int(w * s), 8), max(int(h * s), 8))
+            bx, by, bw, bh = box
+            template = small[by:by + bh, bx:bx + bw].copy()
+            if template.shape[0] == bh and template.shape[1] == bw:
+                self.tracks.append((template, box))
+
+    def update(self, gray):
+        """Move every track to its best match; return (faces, confidence) in full-frame coordinates."""
+        if not self.tracks:
+            return [], 0.0
+
+        small = self._shrink(gray)
+        height, width = small.shape[:2]
+        s = self.tracking_scale
+        faces = []
+        confidence = 1.0
+        tracks = []
+
+        for template, (x, y, w, h) in self.tracks:
+            margin_x = int(w * self.search_margin) + 1
+            margin_y = int(h * self.search_margin) + 1
+            x0, y0 = max(0, x - margin_x), max(0, y - margin_y)
+            x1, y1 = min(width, x + w + margin_x), min(height, y + h + margin_y)
+            if x1 - x0 < w or y1 - y0 < h:
+                return [], 0.0
+
+            result = cv2.matchTemplate(small[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            confidence = min(confidence, max_val)
+
+            box = (x0 + max_loc[0], y0 + max_loc[1], w, h)
+            tracks.append((template, box))
+            faces.append((int(box[0] / s), int(box[1] / s), int(w / s), int(h / s)))
+
+        self.tracks = tracks
+        return faces, confidence
+
+    def reset(self):
+        self.tracks = []
+
+
+class DetectionScheduler:
+    """Run the full detector every N frames and track the faces in between.
+
+    The detector also runs whenever there is nothing to track or the tracker's
+    match score drops below min_confidence, so a visitor who turns away or
+    leaves is picked up again on the next frame.
+    """
+
+    def __init__(self, detect_interval=10, min_confidence=0.6, tracker=None):
+        self.detect_interval = detect_interval
+        self.min_confidence = min_confidence
+        self.tracker = tracker or TemplateTracker()
+        self.frames_since_detection = 0
+        self.detected_frames = 0
+        self.tracked_frames = 0
+        self.confidence = 0.0
+
+    def process(self, gray, detect):
+        """Return face boxes for this frame, calling detect(gray) only when it is due."""
+        if self.tracker.tracks and self.frames_since_detection < self.detect_interval:
+            faces, confidence = self.tracker.update(gray)
+            self.confidence = confidence
+            if faces and confidence >= self.min_confidence:
+                self.frames_since_detection += 1
+                self.tracked_frames += 1
+                return faces
+
+        faces = detect(gray)
+        self.tracker.start(gray, faces)
+        self.frames_since_detection = 0
+        self.detected_frames += 1
+        self.confidence = 1.0 if len(faces) else 0.0
+        return faces
+
+    def reset(self):
+        """Drop the tracks so the next frame goes through the full detector."""
+        self.tracker.reset()
+        self.frames_since_detection = 0
+# ===================================================================================================
+
+# ========================================= motion gate =============================================
+class MotionGate:
+    """Skip face detection while nothing moves in the detection zone.
+
+    Each frame the zone is shrunk to a tiny thumbnail and compared with the
+    previous one. The detector only runs when enough of the thumbnail changed,
+    for hold_time seconds after the last change, or while a face is being
+    tracked (a visitor standing still makes no motion).
+    """
+
+    def __init__(self, thumbnail_size=(64, 48), pixel_threshold=25, motion_fraction=0.02, hold_time=2.0):
+        self.thumbnail_size = thumbnail_size
+        self.pixel_threshold = pixel_threshold  # Grey-level change that counts as a changed pixel
+        self.motion_fraction = motion_fraction  # Share of changed pixels that counts as motion
+        self.hold_time = hold_time
+        self.previous = None
+        self.last_motion_time = 0.0
+        self.frames_checked = 0
+        self.frames_skipped = 0
+        self.motion_events = 0
+
+    def allow(self, gray, zone_rect, keep_open=False):
+        """Return True when the detector should run on this frame."""
+        x_start, y_start, x_end, y_end = zone_rect
+        thumbnail = cv2.resize(gray[y_start:y_end, x_start:x_end], self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        thumbnail = cv2.GaussianBlur(thumbnail, (5, 5), 0)
+        now = time.monotonic()
+        self.frames_checked += 1
+
+        if self.previous is None:
+            # This frame only becomes the reference. The very first frame gives the detector one
+            # look; after a resize (a camera profile switch) it must not count as motion, or the
+            # switch to the idle profile would wake the camera straight away
+            moved = self.frames_checked == 1
+        else:
+            diff = cv2.absdiff(thumbnail, self.previous)
+            _, changed = cv2.threshold(diff, self.pixel_threshold, 255, cv2.THRESH_BINARY)
+            moved = cv2.countNonZero(changed) > self.motion_fraction * changed.size
+        self.previous = thumbnail
+
+        if moved:
+            if now - self.last_motion_time > self.hold_time:
+                self.motion_events += 1
+            self.last_motion_time = now
+
+        if keep_open or now - self.last_motion_time <= self.hold_time:
+            return True
+
+        self.frames_skipped += 1
+        return False
+
+    def reset(self):
+        """Forget the reference thumbnail, e.g. after the frame size changed.
+
+        The next frame becomes the new reference without counting as motion.
+        """
+        self.previous = None
+
+    def stats(self):
+        return {
+            "frames_checked": self.frames_checked,
+            "frames_skipped": self.frames_skipped,
+            "motion_events": self.motion_events,
+        }
+# ===================================================================================================
+
+# ========================================= presence ================================================
+class PresenceTracker:
+    """Confirm a visitor over several frames before the kiosk starts talking.
+
+    A visitor counts as present once their face was in zone and in range for
+    enter_count of the last window frames, and stops being present only when
+    that drops to exit_count or fewer. Sightings that never reach enter_count
+    are counted as rejected: those used to start a conversation on their own.
+    """
+
+    def __init__(self, window=10, enter_count=6, exit_count=2):
+        self.history = deque(maxlen=window)
+        self.enter_count = enter_count
+        self.exit_count = exit_count
+        self.present = False
+        self.candidate = False
+        self.triggers = 0
+        self.false_triggers = 0
+        self.rejected = 0
+
+    def update(self, face_in_zone):
+        """Add this frame's result and return whether a visitor is confirmed present."""
+        self.history.append(bool(face_in_zone))
+        hits = sum(self.history)
+
+        if not self.present and hits >= self.enter_count:
+            self.present = True
+            self.candidate = False
+        elif self.present and hits <= self.exit_count:
+            self.present = False
+
+        if not self.present:
+            if face_in_zone:
+                self.candidate = True
+            elif hits == 0 and self.candidate:
+                self.rejected += 1
+                self.candidate = False
+
+        return self.present
+
+    def record_trigger(self):
+        self.triggers += 1
+
+    def record_false_trigger(self):
+        """The conversation started but nobody answered."""
+        self.false_triggers += 1
+
+    def reset(self):
+        self.history.clear()
+        self.present = False
+        self.candidate = False
+
+    def stats(self):
+        return {
+            "triggers": self.triggers,
+            "false_triggers": self.false_triggers,
+            "rejected": self.rejected,
+        }
+# ===================================================================================================
+
+# ========================================= approach prediction =====================================
+class ApproachPredictor:
+    """Predict that a face still too far away is about to come into range.
+
+    Fits a straight line through the recent size and centre of the face; when
+    the face is growing and, lead_time seconds from now, would be big enough
+    and centred in the zone, update() returns True once for that approach.
+    Only sizes measured by the full detector are fitted: tracked boxes keep
+    the size of the last detection and would flatten the growth.
+    """
+
+    def __init__(self, window=8, lead_time=1.5, min_growth=10.0):
+        self.history = deque(maxlen=window)  # (time, size, centre x, centre y)
+        self.lead_time = lead_time           # Seconds ahead the prediction looks
+        self.min_growth = min_growth         # px/s; slower faces are people standing or milling about
+        self.fired = False
+        self.predictions = 0
+
+    def update(self, face, zone_rect, min_face_size, now=None, measured=True):
+        """Add this frame's approaching face (None if there is none) and return whether it is about to arrive.
+
+        measured is False for a face that was tracked rather than detected;
+        it keeps the approach going but adds no sample.
+        """
+        if face is None:
+            self.reset()
+            return False
+        if not measured:
+            return False
+
+        now = time.monotonic() if now is None else now
+        x, y, w, h = face
+        self.history.append((now, max(w, h), x + w / 2.0, y + h / 2.0))
+        if self.fired or len(self.history) < self.history.maxlen // 2:
+            return False
+
+        samples = np.array(self.history, dtype=np.float64)
+        times = samples[:, 0] - samples[-1, 0]
+        if times[0] == 0:
+            return False
+        # Slope and value at the newest frame for size, x and y in one least-squares fit
+        (growth, vx, vy), (size, cx, cy) = np.polyfit(times, samples[:, 1:], 1)
+        if growth < self.min_growth:
+            return False
+
+        ahead = self.lead_time
+        x_start, y_start, x_end, y_end = zone_rect
+        if size + growth * ahead < min_face_size[0]:
+            return False
+        if not (x_start < cx + vx * ahead < x_end and y_start < cy + vy * ahead < y_end):
+            return False
+
+        self.fired = True
+        self.predictions += 1
+        return True
+
+    def reset(self):
+        self.history.clear()
+        self.fired = False
+# ===================================================================================================
+
+# ========================================= re-identification =======================================
+def face_signature(gray, face, size=24):
+    """Small appearance signature of a face: an equalized thumbnail as a unit vector.
+
+    gray may also be a BGR frame; only the face crop is converted.
+
+    Good enough to tell whether the person in front of the kiosk is the one who
+    was just served; it is not an identity and is never stored on disk.
+    """
+    x, y, w, h = face
+    crop = gray[max(0, y):y + h, max(0, x):x + w]
+    if crop.size == 0:
+        return None
+    if crop.ndim == 3:
+        crop = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+    thumbnail = cv2.equalizeHist(cv2.resize(crop, (size, size), interpolation=cv2.INTER_AREA))
+    vector = thumbnail.astype(np.float32).ravel()
+    vector -= vector.mean()
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return None
+    return vector / norm
+
+
+class VisitorCache:
+    """Short-term, in-memory memory of recently served visitors.
+
+    A visitor is remembered once their conversation got an answer and is
+    suppressed until ttl seconds after that; seeing them again does not extend
+    it. Suppressions are counted per visit: frames of the same visitor less
+    than visit_gap seconds apart are one visit. Nothing here is ever written
+    to disk.
+    """
+
+    def __init__(self, ttl=120.0, threshold=0.8, max_entries=20, visit_gap=5.0):
+        self.ttl = ttl
+        self.threshold = threshold  # Correlation above which two signatures are the same visitor
+        self.max_entries = max_entries
+        self.visit_gap = visit_gap
+        self.entries = []           # [served_at, signature, suppressed visits, last seen]
+        self.suppressed = 0         # Suppressed visits, all visitors
+
+    def _evict(self, now):
+        self.entries = [entry for entry in self.entries if now - entry[0] <= self.ttl]
+
+    def remember(self, signature):
+        """Add a visitor who has just been served."""
+        if signature is None:
+            return
+        now = time.monotonic()
+        self._evict(now)
+        self.entries.append([now, signature, 0, now])
+        if len(self.entries) > self.max_entries:
+            self.entries.pop(0)
+
+    def recently_served(self, signature):
+        """Check a signature against recent visitors, counting a new visit if found."""
+        if signature is None:
+            return False
+        now = time.monotonic()
+        self._evict(now)
+        for entry in self.entries:
+            if float(np.dot(entry[1], signature)) >= self.threshold:
+                if now - entry[3] > self.visit_gap:
+                    entry[2] += 1
+                    self.suppressed += 1
+                entry[3] = now
+                return True
+        return False
+
+    def stats(self):
+        now = time.monotonic()
+        self._evict(now)
+        return {
+            "visitors": len(self.entries),
+            "suppressed": self.suppressed,
+            "suppressed_per_visitor": [entry[2] for entry in self.entries],
+        }
+
+    def clear(self):
+        self.entries = []
+# ===================================================================================================
+
+# ========================================= face pipeline ===========================================
+class FacePipeline:
+    """Grayscale frame in, face boxes out.
+
+    Puts together everything between the camera and the zone checks: the
+    motion gate, the detect-then-track scheduler and the detector backend
+    running on the (optionally cropped and downscaled) detection zone.
+    """
+
+    def __init__(self, face_detector, min_face_size=MIN_FACE_SIZE, max_face_size=MAX_FACE_SIZE,
+                 detection_scale=DETECTION_SCALE, zone=DETECTION_ZONE, zone_crop_detection=True,
+                 detect_interval=10, min_confidence=0.6, motion_hold_time=2.0, approach_face_size=None):
+        self.face_detector = face_detector
+        self.min_face_size = tuple(min_face_size)
+        self.max_face_size = tuple(max_face_size)
+        # Smallest face the detector reports; the faces between this and min_face_size are too far away
+        self.approach_face_size = tuple(approach_face_size or (int(v * APPROACH_FACE_SCALE) for v in self.min_face_size))
+        self.detection_scale = detection_scale  # Fraction of the frame resolution the detector runs on
+        self.zone = tuple(zone)  # Zone as fractions of the frame, shared by detector and overlay
+        self.zone_crop_detection = zone_crop_detection  # Only run the detector on the zone plus a half-face margin
+        self.scheduler = DetectionScheduler(detect_interval=detect_interval, min_confidence=min_confidence)
+        self.motion_gate = MotionGate(hold_time=motion_hold_time)
+        self.frame_shape = None
+        self.detected = False  # The full detector ran on the last frame, rather than the tracker
+
+    def zone_rect(self, width, height):
+        return detection_zone(width, height, self.zone)
+
+    def find_faces(self, image, zone_rect):
+        """Run the full face detector on a grayscale (or, for colour backends, BGR) frame"""
+        if self.zone_crop_detection:
+            return detect_faces_in_zone(
+                self.face_detector,
+                image,
+                zone_rect,
+                self.approach_face_size,
+                self.max_face_size,
+                detection_scale=self.detection_scale
+            )
+        return detect_faces_scaled(
+            self.face_detector,
+            image,
+            self.approach_face_size,
+            self.max_face_size,
+            detection_scale=self.detection_scale
+        )
+
+    def process(self, gray, run_detector=True, frame=None):
+        """Return (faces, zone_rect, active) for one grayscale frame.
+
+        active is True when the motion gate let the frame through. With
+        run_detector=False only the gate runs, e.g. on idle-resolution frames
+        where the face size limits do not apply. frame is the BGR original,
+        used by detector backends that work on colour.
+        """
+        # The frame size changed: tracks and the motion reference no longer match
+        if gray.shape != self.frame_shape:
+            self.frame_shape = gray.shape
+            self.reset()
+
+        height, width = gray.shape[:2]
+        zone_rect = self.zone_rect(width, height)
+
+        # Nothing to do while the zone is still and no face is being tracked
+        active = self.motion_gate.allow(gray, zone_rect, keep_open=bool(self.scheduler.tracker.tracks))
+        self.detected = False
+        if not active or not run_detector:
+            return [], zone_rect, active
+
+        detection_image = frame if self.face_detector.color and frame is not None else gray
+        faces = self.scheduler.process(gray, lambda _: self.find_faces(detection_image, zone_rect))
+        self.detected = self.scheduler.frames_since_detection == 0
+        return faces, zone_rect, active
+
+    def reset(self):
+        """Start again from a full detection, e.g. after the camera was paused."""
+        self.scheduler.reset()
+        self.motion_gate.reset()
+
+    def stats(self):
+        stats = self.face_detector.stats()
+        stats.update(self.motion_gate.stats())
+        stats["detected_frames"] = self.scheduler.detected_frames
+        stats["tracked_frames"] = self.scheduler.tracked_frames
+        return stats
+
+
+def create_face_pipeline(config):
+    """Build a FacePipeline from the kiosk settings (kiosk_config.json)."""
+    face_detector = create_face_detector(
+        config.get("face_detector", "haar"),
+        **config.get("face_detector_options", {})
+    )
+    return FacePipeline(
+        face_detector,
+        min_face_size=config.get("min_face_size", MIN_FACE_SIZE),
+        max_face_size=config.get("max_face_size", MAX_FACE_SIZE),
+        detection_scale=config.get("detection_scale", DETECTION_SCALE),
+        zone=config.get("detection_zone", DETECTION_ZONE),
+        zone_crop_detection=config.get("zone_crop_detection", True),
+        detect_interval=config.get("detect_interval", 10),
+        min_confidence=config.get("min_tracking_confidence", 0.6),
+        motion_hold_time=config.get("motion_hold_time", 2.0),
+        approach_face_size=config.get("approach_face_size")
+    )
+# ===================================================================================================
@@ -0,0 +1,132 @@
+import argparse
+import json
+import time
+
+import cv2
+
+from camera_capture import open_frame_source
+from face_detection import (FACE_IN_RANGE, FACE_TOO_FAR, ApproachPredictor, PresenceTracker, classify_faces,
+                            create_face_pipeline)
+
+# Stages timed for every frame, in pipeline order
+STAGES = ("read", "gray", "detect", "presence")
+
+
+# ========================================= replay ==================================================
+def load_config(path):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        print(f"Config file {path} not found. Using default settings.")
+        return {}
+
+
+def replay(source, config, realtime=False, max_frames=None):
+    """Run a recording through the kiosk detection pipeline without a webcam or a UI.
+
+    Returns a report with frame counts, achieved FPS, per-stage latency and the
+    recording time of every conversation trigger and approach prediction.
+    """
+    frame_source = open_frame_source(source, config, realtime=realtime)
+    pipeline = create_face_pipeline(config)
+    presence = PresenceTracker(window=10, enter_count=6, exit_count=2)
+    approach = ApproachPredictor(lead_time=1.5)
+    stage_totals = {stage: 0.0 for stage in STAGES}
+    stage_max = {stage: 0.0 for stage in STAGES}
+    triggers = []
+    approaches = []
+    frames = 0
+    sequence = 0
+    was_present = False
+
+    frame_source.start()
+    start = time.perf_counter()
+    try:
+        while max_frames is None or frames < max_frames:
+            t0 = time.perf_counter()
+            sequence, frame, _ = frame_source.read(sequence)
+            if frame is None:
+                break
+            t1 = time.perf_counter()
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            t2 = time.perf_counter()
+            faces, zone_rect, _ = pipeline.process(gray, frame=frame)
+            t3 = time.perf_counter()
+
+            boxes, status, sizes = classify_faces(faces, zone_rect, pipeline.min_face_size, pipeline.max_face_size)
+            face_in_zone = bool((status == FACE_IN_RANGE).any())
+
+            # Same choice of approaching face as the kiosk: the largest one still too far away
+            too_far = (status == FACE_TOO_FAR).nonzero()[0]
+            approaching_face = tuple(int(v) for v in boxes[too_far[sizes[too_far].argmax()]]) if too_far.size else None
+            if approach.update(approaching_face, zone_rect, pipeline.min_face_size,
+                               now=frame_source.media_time(), measured=pipeline.detected):
+                approaches.append({"frame": frames, "media_time": round(frame_source.media_time(), 3)})
+            present = presence.update(face_in_zone)
+            if present and not was_present:
+                presence.record_trigger()
+                triggers.append({"frame": frames, "media_time": round(frame_source.media_time(), 3)})
+            was_present = present
+            t4 = time.perf_counter()
+
+            for stage, elapsed in zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3)):
+                stage_totals[stage] += elapsed
+                stage_max[stage] = max(stage_max[stage], elapsed)
+            frames += 1
+    finally:
+        frame_source.stop()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "source": str(source),
+        "frames": frames,
+        "seconds": round(elapsed, 3),
+        "fps": round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+        "stages_ms": {
+            stage: {
+                "mean": round(stage_totals[stage] * 1000.0 / max(frames, 1), 3),
+                "max": round(stage_max[stage] * 1000.0, 3),
+            }
+            for stage in STAGES
+        },
+        "triggers": triggers,
+        "approaches": approaches,
+        "pipeline": pipeline.stats(),
+        "presence": presence.stats(),
+    }
+
+
+def print_report(report):
+    print(f"Source:  {report['source']}")
+    print(f"Frames:  {report['frames']} in {report['seconds']} s ({report['fps']} FPS)")
+    print(f"{'Stage':<10}{'mean ms':>10}{'max ms':>10}")
+    for stage, timing in report["stages_ms"].items():
+        print(f"{stage:<10}{timing['mean']:>10.3f}{timing['max']:>10.3f}")
+    print(f"Triggers: {len(report['triggers'])}")
+    for trigger in report["triggers"]:
+        print(f"  frame {trigger['frame']} at {trigger['media_time']:.3f} s")
+    print(f"Approach predictions: {len(report['approaches'])}")
+    for approach in report["approaches"]:
+        print(f"  frame {approach['frame']} at {approach['media_time']:.3f} s")
+# ===================================================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a video file or image directory through the face detection pipeline.")
+    parser.add_argument("source", help="video file, directory of images or camera index")
+    parser.add_argument("--config", default="kiosk_config.json", help="kiosk settings to use")
+    parser.add_argument("--realtime", action="store_true", help="replay at the recorded frame rate instead of as fast as possible")
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = replay(args.source, load_config(args.config), realtime=args.realtime, max_frames=args.max_frames)
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
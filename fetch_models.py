@@ -0,0 +1,83 @@
+import argparse
+import os
+
+import cv2
+import requests
+
+from face_detection import LBP_CASCADE, YUNET_MODEL, create_face_detector
+
+# Model files of the optional detector backends and where they are published
+MODEL_SOURCES = {
+    YUNET_MODEL: "https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/face_detection_yunet_2023mar.onnx",
+    LBP_CASCADE: "https://raw.githubusercontent.com/opencv/opencv/4.x/data/lbpcascades/lbpcascade_frontalface_improved.xml",
+}
+
+# Smallest face the check asks for, well below the kiosk's approach size
+CHECK_MIN_FACE = (24, 24)
+
+
+# ========================================= fetch ===================================================
+def fetch_models(force=False):
+    """Download the model files into models/, skipping the ones already there."""
+    for path, url in MODEL_SOURCES.items():
+        if os.path.exists(path) and not force:
+            print(f"{path} already present")
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        response = requests.get(url, timeout=60)
+        response.raise_for_status()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(response.content)
+        os.replace(temp_path, path)
+        print(f"{path}: {len(response.content)} bytes from {url}")
+# ===================================================================================================
+
+# ========================================= check ===================================================
+def check_backends(image_path, backends=("haar", "lbp", "yunet")):
+    """Load every backend and run it once on an image, checking the (x, y, w, h) box format.
+
+    Returns True when every backend loaded and returned well-formed boxes.
+    """
+    frame = cv2.imread(image_path)
+    if frame is None:
+        print(f"Could not read {image_path}")
+        return False
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    height, width = gray.shape
+
+    ok = True
+    for name in backends:
+        try:
+            detector = create_face_detector(name)
+        except ValueError as e:
+            print(f"{name}: {e}")
+            ok = False
+            continue
+
+        faces = detector.detect(frame if detector.color else gray, CHECK_MIN_FACE, (width, height))
+        well_formed = all(
+            len(face) == 4 and all(isinstance(v, int) for v in face) and face[2] > 0 and face[3] > 0
+            for face in faces
+        )
+        ok = ok and well_formed
+        print(f"{name}: {len(faces)} faces in {detector.last_latency:.1f} ms, "
+              f"boxes {'ok' if well_formed else 'NOT (x, y, w, h) ints'}: {faces[:3]}")
+    return ok
+# ===================================================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download the model files of the YuNet and LBP face detector backends.")
+    parser.add_argument("--force", action="store_true", help="download again even if the files are present")
+    parser.add_argument("--check", metavar="IMAGE", default=None,
+                        help="afterwards run every backend once on this image, ideally one with a face")
+    args = parser.parse_args()
+
+    fetch_models(force=args.force)
+    if args.check and not check_backends(args.check):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# Stages of a face-triggered greeting, in the order they normally happen
+TRACE_STAGES = (
+    "capture",             # Camera frame read
+    "detection",           # Face pipeline finished on that frame
+    "trigger",             # Trigger arbiter started a conversation
+    "conversation_start",  # face_mic_conversation running on the Tk thread
+    "translation",         # First translation returned
+    "synthesis",           # First gTTS file written
+    "mixer_start",         # Mixer started playing
+    "first_word",          # First subtitle word shown
+)
+
+
+# ========================================= session trace ===========================================
+class SessionTrace:
+    """Monotonic timestamps of one visitor's way from camera frame to first spoken word.
+
+    Only the first time a stage is marked counts: later translations and
+    syntheses in the same conversation are not part of the greeting latency.
+    """
+
+    def __init__(self, session_id, capture_time):
+        self.session_id = session_id
+        self.wall_time = time.time()
+        self.marks = {"capture": capture_time}
+
+    def mark(self, stage, timestamp=None):
+        if stage not in self.marks:
+            self.marks[stage] = time.monotonic() if timestamp is None else timestamp
+
+    def offsets_ms(self):
+        """Milliseconds from the camera frame to every recorded stage."""
+        start = self.marks["capture"]
+        return {stage: round((self.marks[stage] - start) * 1000.0, 1) for stage in TRACE_STAGES if stage in self.marks}
+
+    def to_dict(self):
+        return {
+            "session": self.session_id,
+            "time": round(self.wall_time, 3),
+            "offsets_ms": self.offsets_ms(),
+        }
+# ===================================================================================================
+
+# ========================================= latency tracer ==========================================
+class LatencyTracer:
+    """Collect session traces into per-stage latency histograms and a JSONL log.
+
+    One session is open at a time, matching the kiosk's single conversation.
+    For every stage the tracer keeps the last max_samples offsets from the
+    camera frame, from which percentiles are computed on request.
+    """
+
+    def __init__(self, log_path="latency_log.jsonl", max_samples=500):
+        self.log_path = log_path
+        self.samples = {stage: deque(maxlen=max_samples) for stage in TRACE_STAGES}
+        self.current = None
+        self.sessions = 0
+        self._lock = threading.Lock()
+
+    def begin(self, capture_time, detection_time=None):
+        """Open a trace for a new session, closing any unfinished one."""
+        with self._lock:
+            previous = self.current
+            self.sessions += 1
+            self.current = SessionTrace(self.sessions, capture_time)
+            if detection_time is not None:
+                self.current.mark("detection", detection_time)
+        if previous is not None:
+            self._record(previous)
+
+    def mark(self, stage):
+        """Mark a stage on the open session; does nothing when no session is open."""
+        with self._lock:
+            if self.current is not None:
+                self.current.mark(stage)
+
+    def finish(self):
+        """Close the open session and add it to the histograms and the log."""
+        with self._lock:
+            trace = self.current
+            self.current = None
+        if trace is not None:
+            self._record(trace)
+
+    def _record(self, trace):
+        offsets = trace.offsets_ms()
+        with self._lock:
+            for stage, offset in offsets.items():
+                self.samples[stage].append(offset)
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as file:
+                    file.write(json.dumps(trace.to_dict()) + "\n")
+            except OSError as e:
+                print(f"Latency log error: {e}")
+
+    def percentiles(self, quantiles=(50, 90, 99)):
+        """Per-stage count and percentiles in ms since the camera frame."""
+        with self._lock:
+            samples = {stage: np.array(values) for stage, values in self.samples.items() if values}
+        report = {}
+        for stage in TRACE_STAGES:
+            if stage not in samples:
+                continue
+            values = samples[stage]
+            report[stage] = {"count": int(values.size)}
+            for q, value in zip(quantiles, np.percentile(values, quantiles)):
+                report[stage][f"p{q}"] = round(float(value), 1)
+        return report
+
+    def histogram(self, stage, bins=10):
+        """(counts, bin_edges) in ms for one stage, or None before any sample."""
+        with self._lock:
+            values = np.array(self.samples[stage])
+        if not values.size:
+            return None
+        counts, edges = np.histogram(values, bins=bins)
+        return counts.tolist(), [round(float(edge), 1) for edge in edges]
+# ===================================================================================================
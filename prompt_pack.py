@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+
+from deep_translator import GoogleTranslator
+from gtts import gTTS
+
+from tts_cache import normalize_text
+
+# Bump when the pack layout changes; packs built for another version are ignored
+PROMPT_PACK_VERSION = 1
+PROMPT_PACK_DIR = "prompt_pack"
+PROMPT_PACK_LANGUAGES = ("en", "hi", "pa")
+
+# Fixed prompts spoken by the conversation, in English; everything else is translated at runtime
+PROMPTS = {
+    "language_menu": "Kindly select a language. I could understand three languages, Punjabi, English and Hindi. Speak anyone of them.",
+    "language_not_understood": "I couldn't understand your language selection. Please try again.",
+    "selected_english": "Congrates you selected english language.\nKindly tell me, how would you like to get the details?\n1. Case Search\n2. Judgment Search\n3. Filing Search",
+    "selected_punjabi": "Congrates you selected punjabi language.\nKindly tell me, how would you like to get the details?\n1. Case Search\n2. Judgment Search\n3. Filing Search",
+    "selected_hindi": "Congrates you selected hindi language.\nKindly tell me, how would you like to get the details?\n1. Case Search\n2. Judgment Search\n3. Filing Search",
+    "search_type_not_recognized": "No valid search type recognized. Please try again.",
+    "input_not_understood": "I couldn't understand your input. Please try again.",
+    "search_by_case": "Ok. You want to make a search by case search.",
+    "search_by_judgment": "Ok. You want to make a search by judgment search.",
+    "search_by_filing": "Ok. You want to make a search by filing search.",
+    "speak_case_number": "Kindly speak case number.",
+    "case_id_not_recognized": "No valid case ID recognized. Please try again.",
+    "case_not_found": "Case not found.",
+    # Fixed fragments of the case readout, see case_readout.CASE_READOUT
+    "readout_case_type": "Your case details are as follows. Case type",
+    "readout_case_number": "Case number",
+    "readout_filing_year": "Filing year",
+    "readout_petitioner": "The petitioner in this case is",
+    "readout_respondent": "The respondent is",
+    "readout_advocate": "The case is being represented by Advocate",
+    "readout_status": "Currently, the case status is",
+    "readout_next_date": "The next hearing is scheduled for",
+    "readout_thanks": "Thank you.",
+}
+
+
+# ========================================= runtime =================================================
+class PromptPack:
+    """Pre-translated, pre-synthesized fixed prompts, loaded from a pack built by build_prompt_pack.
+
+    A missing or outdated pack simply resolves nothing and the kiosk
+    translates and synthesizes as before. An entry whose English source no
+    longer matches PROMPTS is skipped on its own.
+    """
+
+    def __init__(self, directory=PROMPT_PACK_DIR):
+        self.directory = directory
+        self.texts = {}  # (prompt_id, lang) -> text
+        self.files = {}  # (lang, normalized text) -> audio file
+        self.version = None
+        self.hits = 0
+        self._load()
+
+    def _load(self):
+        manifest_path = os.path.join(self.directory, "manifest.json")
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            print(f"Prompt pack not found in {self.directory}. Prompts will be synthesized at runtime.")
+            return
+
+        if manifest.get("version") != PROMPT_PACK_VERSION:
+            print(f"Prompt pack version {manifest.get('version')} does not match {PROMPT_PACK_VERSION}. Ignoring it.")
+            return
+        self.version = manifest.get("build")
+
+        for prompt_id, entry in manifest.get("prompts", {}).items():
+            if PROMPTS.get(prompt_id) != entry.get("source"):
+                continue
+            for lang, translation in entry.get("languages", {}).items():
+                path = os.path.join(self.directory, translation["file"])
+                if not os.path.exists(path):
+                    continue
+                self.texts[(prompt_id, lang)] = translation["text"]
+                self.files[(lang, normalize_text(translation["text"]))] = path
+
+    def text(self, prompt_id, lang):
+        """Text of a fixed prompt in a language, or None if the pack does not have it."""
+        return self.texts.get((prompt_id, lang))
+
+    def speech_file(self, text, lang):
+        """Audio file for text if it is one of the packed prompts, otherwise None."""
+        path = self.files.get((lang, normalize_text(text)))
+        if path is not None:
+            self.hits += 1
+        return path
+
+    def stats(self):
+        return {"build": self.version, "prompts": len(self.texts), "hits": self.hits}
+# ===================================================================================================
+
+# ========================================= build step ==============================================
+def build_prompt_pack(directory=PROMPT_PACK_DIR, languages=PROMPT_PACK_LANGUAGES, build=None):
+    """Translate and synthesize every fixed prompt once and write the pack with its manifest."""
+    manifest = {"version": PROMPT_PACK_VERSION, "build": build, "languages": list(languages), "prompts": {}}
+    for lang in languages:
+        os.makedirs(os.path.join(directory, lang), exist_ok=True)
+    translators = {lang: GoogleTranslator(source="en", target=lang) for lang in languages if lang != "en"}
+
+    for prompt_id, source in PROMPTS.items():
+        entry = {"source": source, "languages": {}}
+        for lang in languages:
+            text = source if lang == "en" else translators[lang].translate(source)
+            relative_path = os.path.join(lang, f"{prompt_id}.mp3")
+            gTTS(text=text, lang=lang).save(os.path.join(directory, relative_path))
+            entry["languages"][lang] = {"text": text, "file": relative_path.replace(os.sep, "/")}
+            print(f"{lang} {prompt_id}: {text}")
+        manifest["prompts"][prompt_id] = entry
+
+    with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=4)
+    return manifest
+# ===================================================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the prompt audio pack for the kiosk conversation.")
+    parser.add_argument("--output", default=PROMPT_PACK_DIR, help="directory to write the pack to")
+    parser.add_argument("--languages", nargs="+", default=list(PROMPT_PACK_LANGUAGES))
+    parser.add_argument("--build", default=None, help="build label stored in the manifest, e.g. a date")
+    args = parser.parse_args()
+
+    manifest = build_prompt_pack(args.output, args.languages, args.build)
+    print(f"Wrote {len(manifest['prompts'])} prompts in {len(args.languages)} languages to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
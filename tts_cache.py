@@ -0,0 +1,152 @@
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+
+
+# ========================================= TTS audio cache =========================================
+def normalize_text(text):
+    """Collapse whitespace so the same prompt written with different indentation shares an entry."""
+    return re.sub(r"\s+", " ", text).strip()
+
+
+# Titles that end in a full stop but never end a sentence, e.g. "Advocate Dr. R. Singh".
+# Matched case-sensitively, so a sentence ending in "no." still splits
+TITLE_ABBREVIATIONS = ("Dr", "Mr", "Mrs", "Ms", "Sh", "Smt", "Shri", "Km", "Jr", "Sr", "St", "No", "Vs", "vs", "Hon'ble")
+
+_SENTENCE_END = re.compile(
+    "".join(rf"(?<!\b{re.escape(title)}\.)" for title in TITLE_ABBREVIATIONS)
+    + r"(?:(?<=\w\w[.!?])|(?<=\u0964))\s+"
+)
+
+
+def split_sentences(text, min_length=20):
+    """Split text into sentences on ., !, ? and the Devanagari/Gurmukhi danda.
+
+    Pieces shorter than min_length are joined to the following sentence so
+    they are not synthesized on their own.
+    """
+    sentences = []
+    pending = ""
+    # A single letter before the full stop is an initial, not the end of a sentence; nor is a title
+    for piece in _SENTENCE_END.split(normalize_text(text)):
+        pending = f"{pending} {piece}".strip()
+        if len(pending) >= min_length:
+            sentences.append(pending)
+            pending = ""
+    if pending:
+        if sentences:
+            sentences[-1] = f"{sentences[-1]} {pending}"
+        else:
+            sentences.append(pending)
+    return sentences
+
+
+class TTSCache:
+    """Content-addressed cache of synthesized speech on disk.
+
+    Entries are keyed by language plus normalized text and stored as
+    <sha1>.mp3 in the cache directory, so they survive restarts and a cached
+    prompt plays without a network call. When the directory grows past
+    max_bytes the least recently used entries are deleted.
+    """
+
+    def __init__(self, directory="tts_cache", max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> size in bytes, least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """Index the entries already on disk, oldest use first."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".mp3"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(files):
+            self.entries[key] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def key(text, lang):
+        return hashlib.sha1(f"{lang}\n{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + ".mp3")
+
+    def lookup(self, text, lang):
+        """Return the cached audio file for text and lang, or None."""
+        key = self.key(text, lang)
+        with self._lock:
+            if key not in self.entries or not os.path.exists(self.path(key)):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+        try:
+            os.utime(self.path(key))  # Keeps the LRU order across restarts
+        except OSError:
+            pass
+        return self.path(key)
+
+    def speech_file(self, text, lang, synthesize):
+        """Return the audio file for text and lang, calling synthesize() for the MP3 bytes on a miss."""
+        cached = self.lookup(text, lang)
+        if cached is not None:
+            return cached
+        return self.store(text, lang, synthesize())
+
+    def store(self, text, lang, audio):
+        """Write MP3 bytes for text and lang into the cache and return the file."""
+        key = self.key(text, lang)
+        path = self.path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(audio)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self.total_bytes -= self.entries.pop(key, 0)
+            size = os.path.getsize(path)
+            self.entries[key] = size
+            self.total_bytes += size
+        self._evict(keep=key)
+        return path
+
+    def _evict(self, keep=None):
+        with self._lock:
+            for key in list(self.entries):
+                if self.total_bytes <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                try:
+                    os.remove(self.path(key))
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    continue  # Still open in the mixer; try again next time
+                self.total_bytes -= self.entries.pop(key)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "evictions": self.evictions,
+            }
+# ===================================================================================================